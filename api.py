@@ -0,0 +1,201 @@
+"""API JSON untuk prediksi klaster tanpa Streamlit.
+
+Jalankan dengan ``python api.py --port 8000`` (atau server WSGI lain, mis.
+``gunicorn -k gthread --threads 32 api:app``).
+
+    POST /predict   {"stasiun": 0, "pm10": 50, ...}  atau  {"records": [{...}, {...}]}
+    POST /similar   {"pm10": 50, ..., "k": 5}  atau  {"records": [{...}], "k": 5}
+    GET  /health    informasi model yang sedang dimuat
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIServer, make_server
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import prediction
+import similarity
+from model_registry import promoted_labels, registry as model_registry
+from refresher import refresher
+
+
+class MicroBatcher:
+    # Menggabungkan permintaan yang datang bersamaan menjadi satu panggilan predict_proba
+
+    def __init__(self, registry, max_batch=1024, max_wait=0.005):
+        self.registry = registry
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, features):
+        future = Future()
+        self._queue.put((features, future))
+        return future
+
+    def _collect(self):
+        items = [self._queue.get()]
+        rows = len(items[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while rows < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            items.append(item)
+            rows += len(item[0])
+        return items
+
+    def _run(self):
+        while True:
+            items = self._collect()
+            try:
+                model = self.registry.get()
+                batch = pd.concat([features for features, _ in items], ignore_index=True)
+                proba = prediction.predict_proba(model, batch, self.registry.version())
+                classes = np.asarray(model.classes_)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for features, future in items:
+                future.set_result((classes, proba[offset:offset + len(features)]))
+                offset += len(features)
+
+
+batcher = MicroBatcher(model_registry)
+
+
+def predict_records(records):
+    features = prediction.validate(pd.DataFrame.from_records(records))
+    classes, proba = batcher.submit(features).result()
+    return [
+        {'cluster': int(classes[row.argmax()]),
+         'probabilities': {str(label): float(p) for label, p in zip(classes, row)}}
+        for row in proba
+    ]
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def _cluster_version(labels):
+    # Versi df2 yang sedang berlaku: label model yang dipromosikan, atau data store 'kmeans'
+    return 'model-' + labels[1] if labels else data_store.version('kmeans')
+
+
+def similarity_index():
+    # Indeks KD-tree atas df2 dari salinan lokal (tanpa mengunduh di dalam permintaan; sumber
+    # diperbarui oleh refresher) atau label model yang dipromosikan, dibangun ulang hanya jika
+    # versinya berubah
+    global _index, _index_version
+    refresher.start()
+    labels = promoted_labels()
+    with _index_lock:
+        if _index is None or _cluster_version(labels) != _index_version:
+            frame = data_store.load_labels(*labels) if labels else data_store.load('kmeans', fetch=False)
+            _index = similarity.SimilarityIndex(frame)
+            _index_version = data_store.frame_version(frame)
+        return _index
+
+
+def similar_records(records, k=5):
+    queries = pd.DataFrame.from_records(records)
+    missing = [column for column in similarity.POLLUTANTS if column not in queries.columns]
+    if missing:
+        raise ValueError('Kolom tidak ditemukan: ' + ', '.join(missing))
+    queries = queries[similarity.POLLUTANTS].apply(pd.to_numeric, errors='coerce')
+    if queries.isna().any().any():
+        raise ValueError('Kolom polutan berisi nilai kosong/non-numerik')
+    neighbours = similarity_index().neighbours(queries, int(k))
+    return [group.drop(columns='query').to_dict(orient='records') for _, group in neighbours.groupby('query')]
+
+
+def _json_response(start_response, status, payload):
+    body = json.dumps(payload).encode('utf-8')
+    start_response(status, [('Content-Type', 'application/json'), ('Content-Length', str(len(body)))])
+    return [body]
+
+
+def app(environ, start_response):
+    method = environ['REQUEST_METHOD']
+    path = environ.get('PATH_INFO', '')
+
+    if method == 'GET' and path == '/health':
+        return _json_response(start_response, '200 OK', {'status': 'ok', 'model': model_registry.info(),
+                                                          'prediction_cache': prediction.cache.stats()})
+
+    if method == 'POST' and path == '/predict':
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            payload = json.loads(environ['wsgi.input'].read(length) or b'null')
+            if isinstance(payload, dict) and 'records' in payload:
+                records = payload['records']
+            elif isinstance(payload, dict):
+                records = [payload]
+            else:
+                records = payload
+            if not isinstance(records, list) or not records:
+                raise ValueError('Body harus berupa objek fitur atau {"records": [...]}')
+            predictions = predict_records(records)
+        except (TypeError, ValueError) as e:
+            return _json_response(start_response, '400 Bad Request', {'error': str(e)})
+        return _json_response(start_response, '200 OK', {'predictions': predictions})
+
+    if method == 'POST' and path == '/similar':
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+            payload = json.loads(environ['wsgi.input'].read(length) or b'null')
+            if not isinstance(payload, dict):
+                raise ValueError('Body harus berupa objek polutan atau {"records": [...], "k": 5}')
+            k = payload.get('k', 5)
+            records = payload['records'] if 'records' in payload else [payload]
+            if not isinstance(records, list) or not records:
+                raise ValueError('Body harus berupa objek polutan atau {"records": [...], "k": 5}')
+            if not isinstance(k, int) or isinstance(k, bool) or not 1 <= k <= similarity.MAX_K:
+                raise ValueError(f'k harus bilangan bulat antara 1 dan {similarity.MAX_K}')
+            neighbours = similar_records(records, k)
+        except (TypeError, ValueError) as e:
+            return _json_response(start_response, '400 Bad Request', {'error': str(e)})
+        except OSError:
+            return _json_response(start_response, '503 Service Unavailable',
+                                  {'error': 'dataset kmeans belum tersedia secara lokal'})
+        return _json_response(start_response, '200 OK', {'neighbours': neighbours})
+
+    return _json_response(start_response, '404 Not Found', {'error': 'not found'})
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='API prediksi klaster kualitas udara')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    model_registry.get()
+    with make_server(args.host, args.port, app, server_class=ThreadingWSGIServer) as server:
+        print(f'Serving on http://{args.host}:{args.port}')
+        server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
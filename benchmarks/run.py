@@ -0,0 +1,266 @@
+"""Benchmark jalur-jalur utama aplikasi secara offline.
+
+    python -m benchmarks.run --scale 1 10 100 -o hasil.json
+    python -m benchmarks.run --compare lama.json baru.json
+    python -m benchmarks.run --update-fixtures          # maintainer: ganti fixture dengan data sumber terbaru
+
+Fixture ikut di repo (benchmarks/fixtures/): cleaned.csv dan kmeans.csv (3000
+station-day dengan skema yang sama dengan 'Data Cleaned (4).csv' dan
+'Modelling (K-Means) 2.csv') serta salinan knn.sav, sehingga benchmark selalu
+berjalan offline. --update-fixtures hanya untuk maintainer yang ingin menggantinya
+dengan salinan sumber (perlu koneksi) dan meng-commit hasilnya. Dengan --scale N, dataset diperbanyak N kali (dengan sedikit
+noise pada kolom polutan) untuk melihat perilaku pada data yang lebih besar.
+Hasil berupa JSON (min/median/mean per benchmark, dalam detik) yang dapat
+dibandingkan antar commit.
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(REPO_DIR, 'benchmarks', 'fixtures')
+DATASETS = ['cleaned', 'kmeans']
+POLLUTANT_COLUMNS = ['pm10', 'so2', 'co', 'o3', 'no2', 'max']
+
+
+def timed(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'min': min(times), 'median': statistics.median(times), 'mean': statistics.fmean(times), 'repeat': repeat}
+
+
+def update_fixtures():
+    import data_store
+
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    for name in DATASETS:
+        data_store.load(name).to_csv(os.path.join(FIXTURES_DIR, name + '.csv'), index=False)
+    shutil.copy(os.path.join(REPO_DIR, 'knn.sav'), os.path.join(FIXTURES_DIR, 'knn.sav'))
+    print(f'Fixture diperbarui di {FIXTURES_DIR}')
+
+
+def scaled(frame, scale, seed=0):
+    # Perbanyak baris `scale` kali; salinan selain yang pertama diberi noise kecil pada polutan
+    import numpy as np
+    import pandas as pd
+
+    if scale == 1:
+        return frame
+    rng = np.random.default_rng(seed)
+    copies = [frame]
+    for _ in range(scale - 1):
+        copy = frame.copy()
+        columns = [column for column in POLLUTANT_COLUMNS if column in copy.columns]
+        copy[columns] = copy[columns] * rng.normal(1.0, 0.02, size=(len(copy), len(columns)))
+        copies.append(copy)
+    return pd.concat(copies, ignore_index=True)
+
+
+def prepare_store(data_dir, scale):
+    # Tulis fixture (sudah diskalakan) sebagai data store lokal di data_dir
+    import pandas as pd
+
+    import data_store
+
+    frames = {}
+    for name in DATASETS:
+        frame = data_store.normalize(name, scaled(pd.read_csv(os.path.join(FIXTURES_DIR, name + '.csv')), scale))
+        digest = hashlib.sha256(pd.util.hash_pandas_object(frame).values.tobytes()).hexdigest()
+        data_store.save(name, frame, {'url': 'fixture', 'etag': None, 'sha256': digest, 'fetched_at': time.time()})
+        frames[name] = frame
+    return frames
+
+
+def bench_scale(scale, repeat, apptest):
+    import numpy as np
+    import pandas as pd
+
+    import charts
+    import data_store
+    import ingest
+    import prediction
+    from model_registry import ModelRegistry
+
+    results = {}
+    frames = prepare_store(data_store.DATA_DIR, scale)
+    df, df2 = frames['cleaned'], frames['kmeans']
+
+    # Load
+    csv_path = os.path.join(data_store.DATA_DIR, 'cleaned.csv')
+    df.to_csv(csv_path, index=False)
+    results['load.csv'] = timed(lambda: pd.read_csv(csv_path), repeat)
+    results['load.parquet'] = timed(lambda: data_store.load('cleaned', fetch=False), repeat)
+    results['memory.cleaned_bytes'] = {'value': int(df.memory_usage(deep=True).sum())}
+    results['memory.kmeans_bytes'] = {'value': int(df2.memory_usage(deep=True).sum())}
+
+    # Filter Dasbor
+    year = int(df['year'].iloc[0])
+    stations = sorted(df['stasiun'].unique())[:3]
+    categories = sorted(df['categori'].unique())[:3]
+
+    def scan():
+        selected = df[df['year'] == year].sort_values(by='year', ascending=False)
+        return selected[selected['stasiun'].isin(stations) & selected['categori'].isin(categories)]
+
+    index = data_store.FrameIndex(df, ['year', 'stasiun', 'categori'])
+    selection = {'year': [year], 'stasiun': stations, 'categori': categories}
+    results['filter.scan'] = timed(scan, repeat)
+    results['filter.index_build'] = timed(lambda: data_store.FrameIndex(df, ['year', 'stasiun', 'categori']), repeat)
+    results['filter.index_select'] = timed(lambda: index.select(**selection), repeat)
+    results['filter.index_count'] = timed(lambda: index.count(**selection), repeat)
+
+    # Agregasi
+    results['groupby.stasiun_critical'] = timed(
+        lambda: df.groupby(['stasiun', 'critical']).size().unstack(fill_value=0), repeat)
+    results['corr.pandas'] = timed(lambda: df[ingest.stats.POLLUTANTS].corr(), repeat)
+    aggregates = ingest.aggregate(df)
+    results['corr.aggregate_build'] = timed(lambda: ingest.aggregate(df), repeat)
+    results['corr.merged_summary'] = timed(lambda: ingest.summary(aggregates=aggregates).correlation(), repeat)
+
+    # Render grafik (spesifikasi Plotly dan PNG matplotlib bila tersedia)
+    for chart in ['categori_distribution', 'pollutant_correlation', 'critical_per_station', 'categori_composition']:
+        results[f'render.plotly.{chart}'] = timed(lambda: json.dumps(getattr(charts, chart)(aggregates)), repeat)
+    try:
+        import figures
+
+        for chart in ['categori_distribution', 'pollutant_correlation', 'critical_per_station']:
+            results[f'render.png.{chart}'] = timed(lambda: getattr(figures, chart)(aggregates), repeat)
+    except ImportError:
+        pass
+
+    # Prediksi
+    registry = ModelRegistry(os.path.join(FIXTURES_DIR, 'knn.sav'))
+    model = registry.get()
+    features = df[prediction.FEATURES]
+    single = features.iloc[[0]]
+    results['predict.single'] = timed(lambda: model.predict(single), repeat)
+    results['predict.batch'] = timed(lambda: prediction.score(model, df), repeat)
+    results['predict.batch_cached'] = timed(
+        lambda: prediction.score(model, df, version=registry.version()), repeat)
+    # Permintaan kecil (micro-batch API) yang dilayani cache LRU
+    small = df.iloc[:prediction.CACHE_MAX_ROWS]
+    results['predict.small_cached'] = timed(
+        lambda: prediction.predict_proba(model, small, registry.version()), repeat)
+    results['predict.rows'] = {'value': int(len(features))}
+
+    if apptest:
+        results.update(bench_pages(repeat))
+
+    results['rows'] = {'cleaned': int(len(df)), 'kmeans': int(len(df2)), 'clusters': int(np.unique(df2['kmeans_label']).size)}
+    return results
+
+
+def bench_pages(repeat):
+    # Rerun halaman penuh lewat Streamlit AppTest
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    # Cache Streamlit bersifat global per proses; kosongkan agar skala sebelumnya tidak terpakai
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+    results = {}
+    app_path = os.path.join(REPO_DIR, 'app.py')
+    for page, option in [('dasbor', None), ('visualisasi', 'Visualisasi'), ('prediksi', 'Prediksi')]:
+        at = AppTest.from_file(app_path, default_timeout=300)
+        start = time.perf_counter()
+        at.run()
+        if option:
+            at.sidebar.radio[0].set_value(option).run()
+        results[f'page.{page}.first'] = {'value': time.perf_counter() - start}
+        results[f'page.{page}.rerun'] = timed(at.run, repeat)
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old_path, new_path):
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    for scale, results in new['scales'].items():
+        print(f'== skala {scale}x')
+        for name, result in results.items():
+            before = old['scales'].get(scale, {}).get(name)
+            if 'median' not in result or not before or 'median' not in before:
+                continue
+            ratio = result['median'] / before['median'] if before['median'] else float('inf')
+            print(f'{name:45s} {before["median"] * 1000:10.2f} ms -> {result["median"] * 1000:10.2f} ms  ({ratio:.2f}x)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark aplikasi kualitas udara')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1], help='faktor perbanyakan dataset, mis. 1 10 100 1000')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--no-apptest', action='store_true', help='lewati rerun halaman via Streamlit AppTest')
+    parser.add_argument('-o', '--output', help='tulis hasil JSON ke file ini (default: stdout)')
+    parser.add_argument('--update-fixtures', action='store_true')
+    parser.add_argument('--compare', nargs=2, metavar=('LAMA', 'BARU'))
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_DIR)
+    os.chdir(REPO_DIR)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.update_fixtures:
+        update_fixtures()
+        return
+    if not all(os.path.exists(os.path.join(FIXTURES_DIR, name)) for name in ['cleaned.csv', 'kmeans.csv', 'knn.sav']):
+        parser.error(f'fixture tidak lengkap di {FIXTURES_DIR}; pulihkan dari git (git checkout -- benchmarks/fixtures)')
+
+    report = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+        'scales': {},
+    }
+    for scale in args.scale:
+        # Setiap skala memakai data store sementara tersendiri; app berjalan offline, dan
+        # direktori model kosong membuat models/current.json lokal tidak ikut terpakai
+        data_dir = tempfile.mkdtemp(prefix='aq-bench-')
+        os.environ['AQ_DATA_DIR'] = data_dir
+        os.environ['AQ_MODEL_DIR'] = data_dir
+        os.environ['AQ_OFFLINE'] = '1'
+        if 'render_pool' in sys.modules:
+            sys.modules['render_pool'].pool.shutdown()
+        for module in [name for name in sys.modules if name.startswith('views')] + [
+                'data_store', 'ingest', 'figure_cache', 'figures', 'charts', 'prediction', 'cluster_profile',
+                'refresher', 'model_registry', 'render_pool']:
+            sys.modules.pop(module, None)
+        try:
+            report['scales'][str(scale)] = bench_scale(scale, args.repeat, not args.no_apptest)
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+        print(f'skala {scale}x selesai', file=sys.stderr)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
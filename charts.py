@@ -0,0 +1,97 @@
+"""Spesifikasi grafik Plotly (dict JSON) yang digambar di browser.
+
+Server hanya menghitung array agregat kecil; tidak ada rasterisasi matplotlib.
+Renderer PNG (figures.py) dipakai untuk ekspor PNG panel Visualisasi lewat render_pool.py.
+"""
+import ingest
+from cluster_profile import COUNT_CHARTS
+
+VIRIDIS = ['#440154', '#3b528b', '#21918c', '#5ec962', '#fde725']
+
+
+def _labels(index):
+    return [str(value) for value in index]
+
+
+def _layout(title, xlabel=None, ylabel=None, **extra):
+    layout = {'title': {'text': title}, 'margin': {'t': 60, 'l': 40, 'r': 20, 'b': 40}}
+    if xlabel is not None:
+        layout['xaxis'] = {'title': {'text': xlabel}, 'type': 'category'}
+    if ylabel is not None:
+        layout['yaxis'] = {'title': {'text': ylabel}}
+    layout.update(extra)
+    return layout
+
+
+def categori_distribution(aggregates, years=None, stations=None):
+    counts = ingest.summary(years, stations, aggregates).categori.as_series()
+    return {
+        'data': [{'type': 'bar', 'x': _labels(counts.index), 'y': counts.tolist(), 'text': counts.tolist(),
+                  'textposition': 'outside', 'marker': {'color': VIRIDIS[:len(counts)]}}],
+        'layout': _layout('Persebaran Kategori Kualitas Udara', 'categori', 'count'),
+    }
+
+
+def pollutant_correlation(aggregates, years=None, stations=None):
+    corr = ingest.summary(years, stations, aggregates).correlation().round(2)
+    labels = corr.columns.tolist()
+    return {
+        # NaN (potongan kosong atau kolom konstan) dikirim sebagai null: sel kosong di heatmap
+        'data': [{'type': 'heatmap', 'z': corr.astype(object).where(corr.notna(), None).to_numpy().tolist(),
+                  'x': labels, 'y': labels,
+                  'colorscale': 'RdBu', 'reversescale': True, 'zmin': -1, 'zmax': 1,
+                  'texttemplate': '%{z:.2f}', 'xgap': 1, 'ygap': 1}],
+        'layout': _layout('Korelasi antara Polutan', yaxis={'autorange': 'reversed'}),
+    }
+
+
+def critical_per_station(aggregates, years=None, stations=None):
+    grouped_data = ingest.critical_table(years, stations, aggregates)
+    return {
+        'data': [{'type': 'bar', 'name': str(critical), 'x': _labels(grouped_data.index),
+                  'y': grouped_data[critical].tolist(), 'text': grouped_data[critical].tolist(),
+                  'textposition': 'inside'}
+                 for critical in grouped_data.columns],
+        'layout': _layout('Jumlah Kolom Critical per Stasiun', 'Stasiun', 'Jumlah',
+                          barmode='stack', legend={'title': {'text': 'Critical'}}),
+    }
+
+
+def categori_composition(aggregates, years=None, stations=None):
+    counts = ingest.summary(years, stations, aggregates).categori.as_series()
+    return {
+        'data': [{'type': 'pie', 'labels': _labels(counts.index), 'values': counts.tolist()}],
+        'layout': _layout('Persentase Kategori Kualitas Udara'),
+    }
+
+
+def cluster_distribution(counts):
+    # Pie + bar jumlah data per klaster; klaster terbanyak diberi warna biru
+    counts = counts.sort_values(ascending=False)
+    colors = ['blue' if label == counts.index[0] else 'grey' for label in counts.index]
+    return {
+        'data': [
+            {'type': 'pie', 'labels': _labels(counts.index), 'values': counts.tolist(),
+             'domain': {'x': [0, 0.45]}, 'sort': False, 'rotation': 140, 'showlegend': False,
+             'textinfo': 'label+percent'},
+            {'type': 'bar', 'x': _labels(counts.index), 'y': counts.tolist(), 'text': counts.tolist(),
+             'textposition': 'outside', 'marker': {'color': colors}, 'xaxis': 'x', 'yaxis': 'y'},
+        ],
+        'layout': _layout('Persentase dan Jumlah KMeans Label',
+                          xaxis={'domain': [0.55, 1], 'type': 'category', 'title': {'text': 'KMeans Label'}},
+                          yaxis={'title': {'text': 'Jumlah'}}),
+    }
+
+
+def cluster_counts(counts, column):
+    # Bar chart jumlah data per nilai kolom dalam satu klaster
+    title, xlabel, color = COUNT_CHARTS[column]
+    return {
+        'data': [{'type': 'bar', 'x': _labels(counts.index), 'y': counts.tolist(), 'text': counts.tolist(),
+                  'textposition': 'outside', 'marker': {'color': [color] + ['grey'] * (len(counts) - 1)}}],
+        'layout': _layout(title, xlabel, 'Jumlah'),
+    }
+
+
+def cluster_profile_charts(profile):
+    return {column: cluster_counts(profile['counts'][column], column) for column in COUNT_CHARTS}
@@ -0,0 +1,62 @@
+import pandas as pd
+
+import ispu
+
+# Kolom yang dihitung jumlahnya per klaster: (judul, label sumbu-x, warna batang terbanyak)
+COUNT_CHARTS = {
+    'stasiun': ('Jumlah per Stasiun', 'Stasiun', 'red'),
+    'critical': ('Jumlah per Critical', 'Critical', 'cyan'),
+    'year': ('Jumlah per Tahun', 'Tahun', 'gold'),
+    'categori': ('Jumlah per Categori', 'Categori', 'lightsalmon'),
+}
+
+POLLUTANTS = ['pm10', 'so2', 'co', 'o3', 'no2']
+
+STATION_NAMES = {
+    0: 'DKI1 (Bunderan HI)',
+    1: 'DKI2 (Kelapa Gading)',
+    2: 'DKI3 (Jagakarsa)',
+    3: 'DKI4 (Lubang Buaya)',
+    4: 'DKI5 (Kebon Jeruk)',
+}
+
+
+def build_profiles(frame, label_column='kmeans_label'):
+    # Satu groupby untuk semua klaster: jumlah data, value_counts tiap kolom, dan rata-rata polutan
+    grouped = frame.groupby(label_column, sort=True)
+    sizes = grouped.size()
+    means = grouped[POLLUTANTS].mean()
+    counts = {column: grouped[column].value_counts() for column in COUNT_CHARTS}
+
+    profiles = {}
+    for label in sizes.index:
+        profiles[label] = {
+            'size': int(sizes[label]),
+            'counts': {column: counts[column].loc[label] for column in COUNT_CHARTS},
+            'means': means.loc[label],
+        }
+    return profiles
+
+
+def cluster_notes(profiles):
+    # Catatan interpretasi per klaster. Kategori AQI rata-rata polutan semua klaster dihitung
+    # sekaligus (ispu.aqi_labels); stasiun/kategori/tahun terbanyak diambil dari value_counts profil.
+    means = pd.DataFrame({label: profile['means'] for label, profile in profiles.items()}).T
+    verdicts = ispu.aqi_labels(means)
+    notes = {}
+    for label, profile in profiles.items():
+        station = int(profile['counts']['stasiun'].idxmax())
+        category = int(profile['counts']['categori'].idxmax())
+        year = int(profile['counts']['year'].idxmax())
+        lines = ['* Air Quality Index: [AQI](https://plutusias.com/air-quality-index/).']
+        lines += [f"*   Berdasarkan hasil rata-rata dari {pollutant.upper()}, parameter polusi ini masuk ke dalam "
+                  f"kategori AQI '{verdicts.loc[label, pollutant]}'." for pollutant in POLLUTANTS]
+        lines += [
+            f'*   Stasiun {STATION_NAMES.get(station, station)} menjadi stasiun pengukuran terbanyak diantara '
+            f'stasiun pengukuran lainnya pada cluster {label}.',
+            f"*   Kategori '{ispu.ISPU_LABELS[category]}' menjadi kategori udara terbanyak diantara kategori udara "
+            f'lainnya pada cluster {label}.',
+            f'*   Tahun {year} menjadi tahun pengukuran terbanyak diantara tahun pengukuran lainnya pada cluster {label}.',
+        ]
+        notes[label] = '\n'.join(lines)
+    return notes
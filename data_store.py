@@ -0,0 +1,380 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pandas as pd
+
+# Sumber data mentah (GitHub); AQ_SOURCE_URL mengganti alamat dasar, mis. server HTTP lokal untuk pengujian
+BASE_URL = os.environ.get(
+    'AQ_SOURCE_URL',
+    'https://raw.githubusercontent.com/CAPSTONEDIGIPRODUCT-KELOMPOK-5/CAPSTONEDIGIPRODUCT_PDAB_KELOMPOK-5/main/')
+
+SOURCES = {
+    # Without K-Means Label
+    'cleaned': BASE_URL + 'Data%20Cleaned%20(4).csv',
+    # With K-Means Label
+    'kmeans': BASE_URL + 'Modelling%20(K-Means)%202.csv',
+}
+
+# Lokasi penyimpanan lokal (Parquet + metadata)
+DATA_DIR = os.environ.get('AQ_DATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+
+# Tipe kolom yang ringkas: kode sebagai integer kecil, nilai polutan (ISPU) sebagai float32.
+# Kode tetap numerik (bukan category) karena dipakai langsung sebagai fitur model dan untuk diurutkan.
+SCHEMA = {
+    'stasiun': 'int8',
+    'critical': 'int8',
+    'categori': 'int8',
+    'year': 'int16',
+    'kmeans_label': 'int8',
+    'pm10': 'float32',
+    'so2': 'float32',
+    'co': 'float32',
+    'o3': 'float32',
+    'no2': 'float32',
+    'max': 'float32',
+}
+
+# Urutan baris yang disimpan; Dasbor mengindeks 'cleaned' dengan urutan yang sama sehingga
+# FrameIndex tidak perlu membuat salinan terurut
+SORT_KEYS = {
+    'cleaned': ['year', 'stasiun', 'categori'],
+}
+
+FETCH_TIMEOUT = 10
+
+# AQ_OFFLINE=1: jangan pernah menghubungi sumber, pakai salinan lokal saja
+OFFLINE = os.environ.get('AQ_OFFLINE') == '1'
+
+# AQ_SHARED_DATA=1: baca dataset dari file Arrow yang di-memory-map (ditulis sekali oleh
+# loader di serve.py), sehingga semua proses worker berbagi halaman memori yang sama
+SHARED = os.environ.get('AQ_SHARED_DATA') == '1'
+
+# Callback yang dipanggil setelah salinan lokal diperbarui, mis. untuk invalidasi cache grafik
+_listeners = []
+
+# Satu penulis per dataset dalam proses ini (refresher, halaman, dan loader serve.py)
+_write_locks = {}
+_write_locks_guard = threading.Lock()
+
+
+def subscribe(callback):
+    _listeners.append(callback)
+
+
+def _parquet_path(name):
+    return os.path.join(DATA_DIR, name + '.parquet')
+
+
+def _arrow_path(name):
+    return os.path.join(DATA_DIR, name + '.arrow')
+
+
+def _meta_path(name):
+    return os.path.join(DATA_DIR, name + '.json')
+
+
+def _read_meta(name):
+    try:
+        with open(_meta_path(name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_lock(name):
+    with _write_locks_guard:
+        return _write_locks.setdefault(name, threading.Lock())
+
+
+def _replace_with(path, write):
+    # Tulis ke file sementara bernama unik di DATA_DIR lalu ganti `path` secara atomik, sehingga
+    # penulis yang berjalan bersamaan (termasuk proses lain) tidak pernah berbagi file sementara
+    os.makedirs(DATA_DIR, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=DATA_DIR, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _write_meta(name, meta):
+    def write(tmp):
+        with open(tmp, 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    _replace_with(_meta_path(name), write)
+
+
+def _fits(values, dtype):
+    # Integer: bulat dan dalam rentang tipe; float: tanpa kehilangan presisi yang berarti
+    if dtype.kind in 'iu':
+        info = np.iinfo(dtype)
+        return bool((values % 1 == 0).all() and values.min() >= info.min and values.max() <= info.max)
+    with np.errstate(over='ignore'):
+        return bool(np.allclose(values.astype(dtype), values, rtol=1e-6, atol=0, equal_nan=True))
+
+
+def apply_schema(frame):
+    # Turunkan tipe kolom sesuai SCHEMA jika aman; kolom yang tidak muat
+    # (atau kolom kode yang berisi nilai kosong) dibiarkan apa adanya
+    for column, dtype in SCHEMA.items():
+        dtype = np.dtype(dtype)
+        if column not in frame.columns or not pd.api.types.is_numeric_dtype(frame[column]):
+            continue
+        if frame[column].dtype == dtype:
+            continue
+        values = frame[column].to_numpy()
+        if dtype.kind in 'iu' and frame[column].isna().any():
+            continue
+        if len(values) and not _fits(values, dtype):
+            continue
+        frame[column] = frame[column].astype(dtype)
+    return frame
+
+
+def normalize(name, frame):
+    # Tipe ringkas + urutan baris baku untuk dataset `name`
+    frame = apply_schema(frame)
+    if name in SORT_KEYS and all(key in frame.columns for key in SORT_KEYS[name]):
+        frame = frame.sort_values(SORT_KEYS[name], kind='stable', ignore_index=True)
+    return frame
+
+
+def save(name, frame, meta):
+    # Tulis frame ke penyimpanan lokal secara atomik beserta metadatanya
+    _replace_with(_parquet_path(name), lambda tmp: frame.to_parquet(tmp, index=False))
+    _write_meta(name, meta)
+
+
+def _store(name, payload, meta):
+    save(name, normalize(name, pd.read_csv(io.BytesIO(payload))), meta)
+
+
+def has_local(name):
+    return os.path.exists(_parquet_path(name))
+
+
+def conditional_headers(name):
+    # If-None-Match untuk permintaan ulang; kosong jika belum ada salinan lokal
+    meta = _read_meta(name)
+    if has_local(name) and meta.get('etag'):
+        return {'If-None-Match': meta['etag']}
+    return {}
+
+
+def store_payload(name, payload, etag=None):
+    # Simpan isi sumber yang baru diunduh jika hash kontennya berubah, lalu beri tahu listener.
+    # Parquet diganti secara atomik sebelum metadata (versi), sehingga pembaca tidak pernah
+    # mendapat versi baru dengan data lama. Mengembalikan True jika salinan lokal diperbarui.
+    digest = hashlib.sha256(payload).hexdigest()
+    new_meta = {'url': SOURCES[name], 'etag': etag, 'sha256': digest, 'fetched_at': time.time()}
+    with _write_lock(name):
+        if has_local(name) and digest == _read_meta(name).get('sha256'):
+            _write_meta(name, new_meta)
+            return False
+        _store(name, payload, new_meta)
+    for callback in _listeners:
+        callback(name)
+    return True
+
+
+def refresh(name, timeout=FETCH_TIMEOUT):
+    # Ambil ulang sumber secara sinkron, hanya jika berubah (ETag / hash konten).
+    # Penyegaran berkala di latar belakang ada di refresher.py.
+    request = urllib.request.Request(SOURCES[name], headers=conditional_headers(name))
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            payload = response.read()
+            etag = response.headers.get('ETag')
+    except (urllib.error.URLError, OSError):
+        # 304 Not Modified, atau offline: gunakan salinan lokal terakhir
+        if has_local(name):
+            return False
+        raise
+    return store_payload(name, payload, etag)
+
+
+# Kunci metadata skema Arrow yang menyimpan versi data di dalam file Arrow itu sendiri
+ARROW_VERSION_KEY = b'aq_version'
+
+# File Arrow untuk df2 berlabel model yang dipromosikan train.py (data/labels.arrow)
+LABELS = 'labels'
+
+
+def _write_arrow(name, table, data_version):
+    import pyarrow.ipc as ipc
+
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                           ARROW_VERSION_KEY: data_version.encode()})
+
+    def write(tmp):
+        with ipc.new_file(tmp, table.schema) as writer:
+            writer.write_table(table)
+
+    _replace_with(_arrow_path(name), write)
+
+
+def publish(name):
+    # Tulis salinan Arrow IPC tanpa kompresi dari salinan lokal, untuk dibaca lewat memory map.
+    # Versinya ikut ditulis di metadata skema, sehingga worker membaca versi dari file yang
+    # sama dengan datanya (bukan dari <name>.json yang diperbarui lebih dulu).
+    import pyarrow as pa
+
+    with _write_lock(name):
+        data_version = version_from_meta(name)
+        table = pa.Table.from_pandas(normalize(name, pd.read_parquet(_parquet_path(name))), preserve_index=False)
+    _write_arrow(name, table, data_version)
+
+
+def _published_labels(data_version):
+    return os.path.exists(_arrow_path(LABELS)) and _arrow_version(LABELS) == data_version
+
+
+def publish_labels(path, model_version):
+    # Seperti publish, untuk labels.parquet model yang dipromosikan. Dilewati jika versi model
+    # itu sudah diterbitkan; mengembalikan True jika file Arrow ditulis ulang.
+    import pyarrow as pa
+
+    data_version = 'model-' + model_version
+    if _published_labels(data_version):
+        return False
+    table = pa.Table.from_pandas(apply_schema(pd.read_parquet(path)), preserve_index=False)
+    _write_arrow(LABELS, table, data_version)
+    return True
+
+
+def _arrow_version(name):
+    # Hanya footer dan skema yang dibaca; datanya tidak disentuh
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    with pa.memory_map(_arrow_path(name), 'r') as source:
+        metadata = ipc.open_file(source).schema.metadata or {}
+    return metadata.get(ARROW_VERSION_KEY, b'').decode()
+
+
+def load_shared(name):
+    # Frame di atas halaman file yang di-memory-map: kolom numerik tanpa nilai kosong tidak
+    # disalin ke memori proses (dan bersifat read-only). File yang diganti loader tetap
+    # valid bagi proses yang masih memetakannya.
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    table = ipc.open_file(pa.memory_map(_arrow_path(name), 'r')).read_all()
+    frame = table.to_pandas(split_blocks=True)
+    frame.attrs['version'] = (table.schema.metadata or {}).get(ARROW_VERSION_KEY, b'').decode()
+    return frame
+
+
+def load(name, fetch=True):
+    if SHARED and os.path.exists(_arrow_path(name)):
+        return load_shared(name)
+    if fetch and not OFFLINE:
+        refresh(name)
+    # Versi dibaca sebelum datanya: Parquet diganti sebelum metadata, jadi data yang terbaca
+    # tidak pernah lebih lama dari versi yang dicatat
+    data_version = version_from_meta(name)
+    # Salinan lokal lama (sebelum SCHEMA memuat kolom polutan) ikut diringkas saat dibaca
+    frame = apply_schema(pd.read_parquet(_parquet_path(name)))
+    frame.attrs['version'] = data_version
+    return frame
+
+
+def load_labels(path, model_version):
+    # df2 hasil train.py (fitur + kmeans_label) untuk model yang dipromosikan. Dalam mode bersama
+    # dibaca lewat memory map dari file yang diterbitkan loader (publish_labels); sampai loader
+    # menerbitkan versi model ini, labels.parquet dibaca langsung
+    if SHARED and _published_labels('model-' + model_version):
+        return load_shared(LABELS)
+    frame = apply_schema(pd.read_parquet(path))
+    frame.attrs['version'] = 'model-' + model_version
+    return frame
+
+
+def partition(frame, column):
+    # Indeks baris (posisi) per nilai kolom, tanpa menyalin data
+    return dict(frame.groupby(column, sort=True).indices)
+
+
+class FrameIndex:
+    # Indeks bertingkat (mis. year -> stasiun -> categori) atas frame yang terurut.
+    # Setiap kombinasi nilai kunci menunjuk ke rentang baris (start, stop), sehingga
+    # filter dan jumlah data cukup dihitung dari rentang tanpa memindai seluruh frame.
+    # Frame yang sudah terurut (lihat SORT_KEYS) dipakai langsung tanpa disalin.
+
+    def __init__(self, frame, keys):
+        self.keys = list(keys)
+        codes = frame[self.keys].to_numpy()
+        if len(codes) > 1 and (np.lexsort(codes.T[::-1]) != np.arange(len(codes))).any():
+            frame = frame.sort_values(self.keys, kind='stable')
+            codes = frame[self.keys].to_numpy()
+        if not frame.index.equals(pd.RangeIndex(len(frame))):
+            frame = frame.reset_index(drop=True)
+        self.frame = frame
+        change = np.flatnonzero((codes[1:] != codes[:-1]).any(axis=1)) + 1
+        starts = np.r_[0, change] if len(codes) else np.array([], dtype=int)
+        stops = np.r_[change, len(codes)] if len(codes) else np.array([], dtype=int)
+        self.ranges = {tuple(v.item() for v in codes[start]): (int(start), int(stop))
+                       for start, stop in zip(starts, stops)}
+
+    def _groups(self, selection):
+        # selection: {kunci: nilai yang dipilih}; kunci yang tidak disebut berarti semua nilai
+        allowed = [set(selection[key]) if key in selection else None for key in self.keys]
+        for group, bounds in self.ranges.items():
+            if all(values is None or value in values for value, values in zip(group, allowed)):
+                yield group, bounds
+
+    def values(self, key, **selection):
+        position = self.keys.index(key)
+        return sorted({group[position] for group, _ in self._groups(selection)})
+
+    def count(self, **selection):
+        return sum(stop - start for _, (start, stop) in self._groups(selection))
+
+    def counts(self, **selection):
+        return {group: stop - start for group, (start, stop) in self._groups(selection)}
+
+    def rows(self, **selection):
+        # Posisi baris (pada self.frame) untuk kombinasi yang dipilih
+        bounds = [bounds for _, bounds in self._groups(selection)]
+        if not bounds:
+            return np.array([], dtype=np.int64)
+        return np.concatenate([np.arange(start, stop) for start, stop in bounds])
+
+    def select(self, **selection):
+        bounds = [bounds for _, bounds in self._groups(selection)]
+        if len(bounds) == 1:
+            start, stop = bounds[0]
+            return self.frame.iloc[start:stop]
+        return self.frame.iloc[self.rows(**selection)]
+
+
+def version_from_meta(name):
+    # Versi dataset = hash konten sumber yang tersimpan
+    return _read_meta(name).get('sha256', '')[:12]
+
+
+def frame_version(frame):
+    # Versi data yang benar-benar dimuat ke frame ini (lihat load); dipakai sebagai kunci cache
+    # turunan (indeks, profil), sehingga turunan tidak pernah disimpan di bawah versi lain
+    return frame.attrs.get('version', '')
+
+
+def version(name):
+    # Dalam mode bersama, versi diambil dari file Arrow yang benar-benar dibaca load_shared:
+    # file baru (data + versi) menggantikan file lama dalam satu os.replace
+    if SHARED and os.path.exists(_arrow_path(name)):
+        return _arrow_version(name)
+    return version_from_meta(name)
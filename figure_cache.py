@@ -0,0 +1,77 @@
+import io
+import threading
+from collections import OrderedDict
+
+import data_store
+import instrument
+
+
+def to_png(fig):
+    # Rasterisasi figure matplotlib ke PNG lalu tutup figure-nya
+    import matplotlib.pyplot as plt
+
+    with instrument.stage('png_serialize'):
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', bbox_inches='tight')
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+class FigureCache:
+    # Cache LRU hasil render (PNG bytes / JSON plotly), dengan kunci (versi data, spesifikasi grafik)
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, version, spec, render):
+        key = (version, spec)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = render()
+        self.put(version, spec, value)
+        return value
+
+    def get(self, version, spec):
+        # Nilai tersimpan atau None, tanpa merender
+        key = (version, spec)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            return None
+
+    def put(self, version, spec, value):
+        with self._lock:
+            self._entries[(version, spec)] = value
+            self._entries.move_to_end((version, spec))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, version=None):
+        # Hapus semua entri, atau hanya entri untuk versi data tertentu
+        with self._lock:
+            if version is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == version]:
+                    del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Satu cache untuk seluruh proses (dipakai bersama oleh semua sesi)
+cache = FigureCache()
+
+# Kosongkan cache setiap kali data store memperbarui salinan lokalnya
+data_store.subscribe(lambda name: cache.invalidate())
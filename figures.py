@@ -0,0 +1,51 @@
+import ingest
+from figure_cache import to_png
+
+# Versi PNG (matplotlib/seaborn) dari grafik di charts.py, mis. untuk ekspor.
+# Semua grafik digambar dari agregat per partisi (lihat ingest.py dan stats.py), bukan dari baris data;
+# years/stations membatasi partisi yang digabung (None = semua).
+# matplotlib, seaborn, dan plotly bersifat opsional dan baru diimpor saat fungsi dipanggil.
+
+
+def categori_distribution(aggregates, years=None, stations=None):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Visualisasi Histogram (Distribution)
+    counts = ingest.summary(years, stations, aggregates).categori.as_series()
+    fig, ax = plt.subplots(figsize=(14, 8))
+    bars = ax.bar(counts.index.astype(str), counts.values, color=sns.color_palette('viridis', len(counts)))
+    ax.bar_label(bars)
+    ax.set_xlabel('categori')
+    ax.set_ylabel('count')
+    ax.set_title('Persebaran Kategori Kualitas Udara')
+    return to_png(fig)
+
+
+def pollutant_correlation(aggregates, years=None, stations=None):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Visualisasi Heatmap (Relationship)
+    corr = ingest.summary(years, stations, aggregates).correlation()
+    fig, ax = plt.subplots(figsize=(10, 8))
+    # Skala tetap -1..1: potongan kosong menghasilkan matriks NaN (lihat stats.Moments.correlation)
+    sns.heatmap(corr, annot=True, cmap='coolwarm', fmt=".2f", linewidths=0.5, vmin=-1, vmax=1, ax=ax)
+    ax.set_title('Korelasi antara Polutan')
+    return to_png(fig)
+
+
+def critical_per_station(aggregates, years=None, stations=None):
+    import matplotlib.pyplot as plt
+
+    # Visualisasi Stacked Bar: jumlah 'critical' per 'stasiun'
+    grouped_data = ingest.critical_table(years, stations, aggregates)
+    fig, ax = plt.subplots(figsize=(14, 8))
+    grouped_data.plot(kind='bar', stacked=True, ax=ax, width=0.8)
+    ax.set_title('Jumlah Kolom Critical per Stasiun')
+    ax.set_xlabel('Stasiun')
+    ax.set_ylabel('Jumlah')
+    ax.legend(title='Critical', loc='upper right')
+    for container in ax.containers:
+        ax.bar_label(container, label_type='center', fontsize=8, color='white')
+    return to_png(fig)
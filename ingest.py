@@ -0,0 +1,254 @@
+"""Ingesti data ISPU baru ke partisi append-only (year/stasiun).
+
+    python ingest.py --seed                      # isi awal dari data store 'cleaned'
+    python ingest.py bacaan_baru.csv ...         # tambahkan file bacaan baru
+    python ingest.py --watch inbox/ --interval 60
+
+Setiap batch ditulis sebagai file Parquet baru di data/readings/year=Y/stasiun=S/,
+dan ringkasan (agregat) per partisi diperbarui secara inkremental di
+data/readings/aggregates.json, tanpa menghitung ulang seluruh riwayat.
+
+Satu append berjalan pada satu waktu (file lock data/readings/.lock), sehingga
+--watch dan ingesti manual tidak saling menimpa agregat. ID batch adalah hash isi
+batch dan dicatat di agregat: file yang sama yang diingesti ulang (mis. setelah
+crash sebelum dipindahkan dari inbox) dilewati. File partisi hanya dibaca jika
+batch-nya sudah tercatat, sehingga batch yang terputus di tengah jalan tidak
+pernah terlihat dan akan ditulis ulang utuh saat dicoba lagi.
+
+File bacaan cukup berisi stasiun, year, dan kelima polutan; max, critical, dan
+categori selalu dihitung ulang dengan ispu.derive. Batch dengan nilai kosong di
+kolom tersebut ditolak utuh. Pada --watch, file yang gagal dipindahkan ke
+inbox/failed dan pemantauan berlanjut.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+import data_store
+import ispu
+import stats
+
+READINGS_DIR = os.path.join(data_store.DATA_DIR, 'readings')
+AGGREGATES_PATH = os.path.join(READINGS_DIR, 'aggregates.json')
+LOCK_PATH = os.path.join(READINGS_DIR, '.lock')
+
+# Kolom wajib di file bacaan; DERIVED_COLUMNS dihitung dari polutan saat append
+REQUIRED_COLUMNS = ['stasiun', *ispu.POLLUTANTS, 'year']
+DERIVED_COLUMNS = ['max', 'critical', 'categori']
+COLUMNS = ['stasiun', *ispu.POLLUTANTS, *DERIVED_COLUMNS, 'year']
+
+
+def _partition_key(year, stasiun):
+    return f'{int(year)}/{int(stasiun)}'
+
+
+def _partition_dir(year, stasiun):
+    return os.path.join(READINGS_DIR, f'year={int(year)}', f'stasiun={int(stasiun)}')
+
+
+def aggregate(frame):
+    # Ringkasan per partisi untuk frame yang sudah ada di memori (tanpa menulis file)
+    aggregates = {'batches': 1, 'rows': int(len(frame)), 'batch_ids': [], 'partitions': {}}
+    for (year, stasiun), part in frame.groupby(['year', 'stasiun'], sort=True):
+        aggregates['partitions'][_partition_key(year, stasiun)] = stats.PartitionStats.from_frame(part)
+    return aggregates
+
+
+def load_aggregates():
+    try:
+        with open(AGGREGATES_PATH) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {'batches': 0, 'rows': 0, 'batch_ids': [], 'partitions': {}}
+    data['partitions'] = {key: stats.PartitionStats.from_dict(part) for key, part in data['partitions'].items()}
+    return data
+
+
+def _write_aggregates(aggregates):
+    data = dict(aggregates, partitions={key: part.to_dict() for key, part in aggregates['partitions'].items()})
+    tmp = AGGREGATES_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp, AGGREGATES_PATH)
+
+
+@contextmanager
+def _locked():
+    # Kunci eksklusif lintas proses selama read-modify-write agregat
+    os.makedirs(READINGS_DIR, exist_ok=True)
+    with open(LOCK_PATH, 'a+') as f:
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def batch_id(frame):
+    # Hash isi batch (kolom + nilai): file yang sama selalu mendapat ID yang sama
+    digest = hashlib.sha256(','.join(map(str, frame.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def append(frame):
+    # Tambahkan batch bacaan baru; hanya partisi yang tersentuh yang ringkasannya diperbarui.
+    # Mengembalikan jumlah baris yang ditambahkan (0 jika batch ini sudah pernah diingesti).
+    missing = [column for column in REQUIRED_COLUMNS if column not in frame.columns]
+    if missing:
+        raise ValueError('Kolom tidak ditemukan: ' + ', '.join(missing))
+    # Baris tanpa year/stasiun tidak masuk partisi mana pun, dan polutan kosong membuat derive
+    # salah: tolak batch daripada diam-diam membuang atau salah menghitung baris
+    incomplete = int(frame[REQUIRED_COLUMNS].isna().any(axis=1).sum())
+    if incomplete:
+        raise ValueError(f'{incomplete} baris memiliki nilai kosong di kolom wajib ({", ".join(REQUIRED_COLUMNS)})')
+    frame = data_store.apply_schema(frame.assign(**ispu.derive(frame)))
+    batch = batch_id(frame)
+
+    with _locked():
+        aggregates = load_aggregates()
+        if batch in aggregates['batch_ids']:
+            return 0
+
+        for (year, stasiun), part in frame.groupby(['year', 'stasiun'], sort=True):
+            directory = _partition_dir(year, stasiun)
+            os.makedirs(directory, exist_ok=True)
+            # Nama file tetap per batch: percobaan ulang menimpa sisa batch yang terputus
+            path = os.path.join(directory, f'part-{batch}.parquet')
+            part.to_parquet(path + '.tmp', index=False)
+            os.replace(path + '.tmp', path)
+
+            key = _partition_key(year, stasiun)
+            aggregates['partitions'].setdefault(key, stats.PartitionStats()).merge(
+                stats.PartitionStats.from_frame(part))
+
+        aggregates['batches'] += 1
+        aggregates['rows'] += int(len(frame))
+        aggregates['batch_ids'].append(batch)
+        _write_aggregates(aggregates)
+    return len(frame)
+
+
+def version(aggregates=None):
+    aggregates = aggregates or load_aggregates()
+    return f"ingest-{aggregates['batches']}-{aggregates['rows']}"
+
+
+def has_partitions():
+    return os.path.exists(AGGREGATES_PATH)
+
+
+def partitions(years=None, stations=None, aggregates=None):
+    # Ringkasan per partisi untuk potongan tahun/stasiun tertentu (None = semua)
+    aggregates = aggregates or load_aggregates()
+    for key, part in aggregates['partitions'].items():
+        year, stasiun = (int(v) for v in key.split('/'))
+        if (years is None or year in years) and (stations is None or stasiun in stations):
+            yield (year, stasiun), part
+
+
+def summary(years=None, stations=None, aggregates=None):
+    # Ringkasan gabungan (histogram + momen) dari partisi yang dipilih
+    return stats.combine(part for _, part in partitions(years, stations, aggregates))
+
+
+def critical_table(years=None, stations=None, aggregates=None):
+    # Tabel jumlah critical per stasiun (bahan stacked bar Perbandingan)
+    per_station = {}
+    for (_, stasiun), part in partitions(years, stations, aggregates):
+        per_station.setdefault(stasiun, stats.Histogram()).merge(part.critical)
+    table = pd.DataFrame.from_dict({stasiun: hist.counts for stasiun, hist in per_station.items()}, orient='index')
+    return table.fillna(0).astype(int).sort_index().sort_index(axis=1)
+
+
+def years_and_stations(aggregates=None):
+    keys = [key for key, _ in partitions(aggregates=aggregates)]
+    return sorted({year for year, _ in keys}), sorted({stasiun for _, stasiun in keys})
+
+
+def load_readings(years=None, stations=None):
+    # Baca hanya partisi yang diminta, dan hanya file dari batch yang sudah tercatat di agregat
+    frames = []
+    if not os.path.isdir(READINGS_DIR):
+        return pd.DataFrame(columns=COLUMNS)
+    committed = {f'part-{batch}.parquet' for batch in load_aggregates()['batch_ids']}
+    for year_dir in sorted(os.listdir(READINGS_DIR)):
+        if not year_dir.startswith('year=') or (years is not None and int(year_dir[5:]) not in years):
+            continue
+        for station_dir in sorted(os.listdir(os.path.join(READINGS_DIR, year_dir))):
+            if stations is not None and int(station_dir[8:]) not in stations:
+                continue
+            directory = os.path.join(READINGS_DIR, year_dir, station_dir)
+            frames.extend(pd.read_parquet(os.path.join(directory, name))
+                          for name in sorted(os.listdir(directory)) if name in committed)
+    if not frames:
+        return pd.DataFrame(columns=COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _read_file(path):
+    if path.lower().endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def watch(inbox, interval):
+    # Proses file baru di inbox secara berkala, lalu pindahkan ke inbox/processed
+    # (atau inbox/failed jika file tidak bisa dibaca atau ditolak append)
+    processed = os.path.join(inbox, 'processed')
+    failed = os.path.join(inbox, 'failed')
+    os.makedirs(processed, exist_ok=True)
+    os.makedirs(failed, exist_ok=True)
+    while True:
+        for name in sorted(os.listdir(inbox)):
+            path = os.path.join(inbox, name)
+            if os.path.isfile(path) and name.lower().endswith(('.csv', '.parquet')):
+                try:
+                    rows = append(_read_file(path))
+                except Exception as e:
+                    shutil.move(path, os.path.join(failed, name))
+                    print(f'{name}: gagal ({e}), dipindahkan ke failed/')
+                    continue
+                shutil.move(path, os.path.join(processed, name))
+                print(f'{name}: {rows} baris ditambahkan' if rows else f'{name}: sudah pernah diingesti, dilewati')
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ingesti bacaan ISPU ke partisi year/stasiun')
+    parser.add_argument('files', nargs='*', help='file CSV/Parquet berisi bacaan baru')
+    parser.add_argument('--seed', action='store_true', help="isi awal dari data store 'cleaned'")
+    parser.add_argument('--watch', metavar='DIR', help='pantau direktori inbox secara berkala')
+    parser.add_argument('--interval', type=float, default=60.0)
+    args = parser.parse_args()
+
+    if args.seed:
+        if has_partitions():
+            parser.error('partisi sudah ada; --seed hanya untuk inisialisasi awal')
+        print(f"seed: {append(data_store.load('cleaned'))} baris")
+    for path in args.files:
+        print(f'{path}: {append(_read_file(path))} baris ditambahkan')
+    if args.watch:
+        watch(args.watch, args.interval)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+"""Instrumentasi per rerun: waktu dan memori setiap tahap.
+
+app.py membuka satu catatan per rerun (``begin``/``end``) yang diberi tag halaman
+(selected_option) dan sub-opsi (selected_option2 / selected_option3 lewat ``tag``).
+Kode halaman membungkus tahap-tahap mahal dengan ``stage``:
+
+    with instrument.stage('filter'):
+        rows = index.rows(**selection)
+
+Tahap bisa bersarang (mis. 'aggregation' di dalam 'figure_render'); waktunya
+dicatat per nama tahap, sehingga tahap luar sudah termasuk tahap dalam. Memori
+adalah selisih RSS proses, jadi bisa tercampur dengan sesi lain yang berjalan
+bersamaan. Di luar rerun (api.py, benchmark) ``stage`` tidak mencatat apa pun.
+
+Hasil tersedia lewat ``recent`` (panel debug), ``prometheus`` (format teks
+Prometheus, ditulis ke AQ_METRICS_FILE bila di-set) dan log JSON per rerun
+(AQ_METRICS_LOG).
+"""
+import functools
+import io
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+METRICS_FILE = os.environ.get('AQ_METRICS_FILE')
+METRICS_LOG = os.environ.get('AQ_METRICS_LOG')
+
+_local = threading.local()
+_lock = threading.Lock()
+_recent = deque(maxlen=500)
+_totals = {}
+_reruns = {}
+
+try:
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+
+def rss():
+    # RSS proses saat ini (byte); di luar Linux memakai puncak RSS dari getrusage
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        try:
+            import resource
+        except ImportError:
+            return 0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def begin(page):
+    _local.record = {'page': page, 'view': None, 'started_at': time.time(), 'stages': {},
+                     '_start': time.perf_counter(), '_rss': rss()}
+
+
+def tag(view):
+    record = getattr(_local, 'record', None)
+    if record is not None:
+        record['view'] = view
+
+
+@contextmanager
+def stage(name):
+    record = getattr(_local, 'record', None)
+    if record is None:
+        yield
+        return
+    start, before = time.perf_counter(), rss()
+    try:
+        yield
+    finally:
+        entry = record['stages'].setdefault(name, {'seconds': 0.0, 'memory': 0, 'calls': 0})
+        entry['seconds'] += time.perf_counter() - start
+        entry['memory'] += rss() - before
+        entry['calls'] += 1
+
+
+def timed(name):
+    # Dekorator: seluruh pemanggilan fungsi dicatat sebagai satu tahap
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def end():
+    # Tutup catatan rerun ini, perbarui total, dan tulis metrik/log bila dikonfigurasi
+    record = getattr(_local, 'record', None)
+    if record is None:
+        return None
+    _local.record = None
+    record['seconds'] = time.perf_counter() - record.pop('_start')
+    record['rss'] = rss()
+    record['memory'] = record['rss'] - record.pop('_rss')
+
+    labels = (record['page'], record['view'] or '')
+    with _lock:
+        _recent.append(record)
+        total = _reruns.setdefault(labels, {'seconds': 0.0, 'count': 0})
+        total['seconds'] += record['seconds']
+        total['count'] += 1
+        for name, entry in record['stages'].items():
+            total = _totals.setdefault(labels + (name,), {'seconds': 0.0, 'growth': 0, 'count': 0})
+            total['seconds'] += entry['seconds']
+            # Counter Prometheus tidak boleh turun: hanya kenaikan RSS yang diakumulasi
+            total['growth'] += max(entry['memory'], 0)
+            total['count'] += entry['calls']
+        if METRICS_LOG:
+            with open(METRICS_LOG, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+        if METRICS_FILE:
+            tmp = METRICS_FILE + '.tmp'
+            with open(tmp, 'w') as f:
+                f.write(_prometheus())
+            os.replace(tmp, METRICS_FILE)
+    return record
+
+
+def recent(page=None):
+    with _lock:
+        return [record for record in _recent if page is None or record['page'] == page]
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _prometheus():
+    lines = [
+        '# HELP aq_rerun_seconds Total waktu rerun per halaman.',
+        '# TYPE aq_rerun_seconds summary',
+    ]
+    for (page, view), total in sorted(_reruns.items()):
+        labels = f'page="{_label(page)}",view="{_label(view)}"'
+        lines.append(f'aq_rerun_seconds_sum{{{labels}}} {total["seconds"]:.6f}')
+        lines.append(f'aq_rerun_seconds_count{{{labels}}} {total["count"]}')
+    lines += [
+        '# HELP aq_stage_seconds Waktu per tahap rerun.',
+        '# TYPE aq_stage_seconds summary',
+    ]
+    for (page, view, name), total in sorted(_totals.items()):
+        labels = f'page="{_label(page)}",view="{_label(view)}",stage="{_label(name)}"'
+        lines.append(f'aq_stage_seconds_sum{{{labels}}} {total["seconds"]:.6f}')
+        lines.append(f'aq_stage_seconds_count{{{labels}}} {total["count"]}')
+    lines += [
+        '# HELP aq_stage_memory_growth_bytes_total Kenaikan RSS kumulatif per tahap rerun (penurunan diabaikan).',
+        '# TYPE aq_stage_memory_growth_bytes_total counter',
+    ]
+    for (page, view, name), total in sorted(_totals.items()):
+        labels = f'page="{_label(page)}",view="{_label(view)}",stage="{_label(name)}"'
+        lines.append(f'aq_stage_memory_growth_bytes_total{{{labels}}} {total["growth"]}')
+    lines += [
+        '# HELP aq_process_resident_memory_bytes RSS proses.',
+        '# TYPE aq_process_resident_memory_bytes gauge',
+        f'aq_process_resident_memory_bytes {rss()}',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def prometheus():
+    with _lock:
+        return _prometheus()
+
+
+def profile(func):
+    # Jalankan func sekali di bawah profiler; pyinstrument jika terpasang, jika tidak cProfile.
+    # Hasil berupa teks laporan (None jika profiler lain sedang aktif di proses ini)
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        Profiler = None
+
+    if Profiler is not None:
+        profiler = Profiler()
+        try:
+            profiler.start()
+        except RuntimeError:
+            func()
+            return None
+        try:
+            func()
+        finally:
+            profiler.stop()
+        return profiler.output_text(unicode=True)
+
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        func()
+        return None
+    try:
+        func()
+    finally:
+        profiler.disable()
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(40)
+    return output.getvalue()
@@ -0,0 +1,58 @@
+"""Klasifikasi ISPU dan AQI secara vektor dengan tabel breakpoint.
+
+Setiap kategori ditentukan oleh batas atas (inklusif); ``np.searchsorted`` memetakan
+seluruh kolom nilai ke indeks kategori sekaligus, tanpa if/elif per baris.
+
+- ``ISPU_BOUNDS``: kategori udara (kolom ``categori``) dari nilai ISPU tertinggi (``max``).
+- ``AQI_BOUNDS``: kategori AQI per polutan (https://plutusias.com/air-quality-index/),
+  dipakai untuk catatan interpretasi klaster.
+"""
+import numpy as np
+import pandas as pd
+
+# Urutan polutan = kode kolom 'critical' (0 = pm10, 1 = so2, 2 = co, 3 = o3, 4 = no2)
+POLLUTANTS = ['pm10', 'so2', 'co', 'o3', 'no2']
+
+# ISPU: 0-50 baik, 51-100 sedang, 101-199 tidak sehat, 200-299 sangat tidak sehat, >= 300 berbahaya
+ISPU_BOUNDS = np.array([50, 100, 199, 299])
+ISPU_LABELS = ['Baik', 'Sedang', 'Tidak Sehat', 'Sangat Tidak Sehat', 'Berbahaya']
+
+# AQI: batas atas kategori per polutan
+AQI_BOUNDS = {
+    'pm10': np.array([50, 100, 250, 350, 430]),
+    'so2': np.array([40, 80, 380, 800, 1600]),
+    'co': np.array([1.0, 2.0, 10, 17, 34]),
+    'o3': np.array([50, 100, 168, 208, 748]),
+    'no2': np.array([40, 80, 180, 280, 400]),
+}
+AQI_LABELS = ['Baik', 'Memuaskan', 'Cukup tercemar', 'Buruk', 'Sangat Buruk', 'Berbahaya/Parah']
+
+
+def categorize(values, bounds):
+    # Indeks kategori untuk setiap nilai: jumlah batas atas yang lebih kecil dari nilai tersebut
+    return np.searchsorted(bounds, np.asarray(values, dtype=np.float64), side='left')
+
+
+def ispu_category(values):
+    return categorize(values, ISPU_BOUNDS)
+
+
+def aqi_category(pollutant, values):
+    return categorize(values, AQI_BOUNDS[pollutant])
+
+
+def aqi_labels(frame):
+    # Label AQI untuk setiap kolom polutan yang ada di frame (mis. rata-rata polutan per klaster)
+    columns = [column for column in POLLUTANTS if column in frame.columns]
+    return pd.DataFrame({column: np.asarray(AQI_LABELS)[aqi_category(column, frame[column])] for column in columns},
+                        index=frame.index)
+
+
+def derive(frame):
+    # max (nilai tertinggi), critical (kode polutan tertinggi), dan categori (kategori ISPU dari max)
+    # untuk semua baris sekaligus
+    values = frame[POLLUTANTS].to_numpy(dtype=np.float64)
+    critical = values.argmax(axis=1) if len(values) else np.zeros(0, dtype=np.int64)
+    maximum = values[np.arange(len(values)), critical]
+    return pd.DataFrame({'max': maximum, 'critical': critical.astype(np.int8),
+                         'categori': ispu_category(maximum).astype(np.int8)}, index=frame.index)
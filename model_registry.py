@@ -0,0 +1,109 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# AQ_MODEL_PATH memaksa satu file model; tanpa itu dipakai model yang dipromosikan
+# train.py (models/current.json), atau knn.sav jika belum pernah dilatih ulang
+MODEL_PATH = os.environ.get('AQ_MODEL_PATH')
+MODEL_DIR = os.environ.get('AQ_MODEL_DIR', os.path.join(BASE_DIR, 'models'))
+POINTER_PATH = os.path.join(MODEL_DIR, 'current.json')
+DEFAULT_MODEL_PATH = os.path.join(BASE_DIR, 'knn.sav')
+
+
+def _pointer():
+    # Isi models/current.json, atau None jika AQ_MODEL_PATH di-set / belum ada model yang dipromosikan
+    if MODEL_PATH:
+        return None
+    try:
+        with open(POINTER_PATH) as f:
+            pointer = json.load(f)
+        return pointer if 'model' in pointer and 'version' in pointer else None
+    except (OSError, ValueError):
+        return None
+
+
+def resolve_path():
+    pointer = _pointer()
+    if pointer is None:
+        return MODEL_PATH or DEFAULT_MODEL_PATH
+    return os.path.join(MODEL_DIR, pointer['model'])
+
+
+def promoted_labels():
+    # (path labels.parquet, versi) dari model yang dipromosikan train.py, atau None.
+    # Label ini menggantikan kmeans_label df2 di seluruh aplikasi, sehingga nomor klaster
+    # di visualisasi, catatan, dan hari serupa selalu sama dengan yang diprediksi classifier.
+    pointer = _pointer()
+    if pointer is None:
+        return None
+    path = os.path.join(MODEL_DIR, pointer['version'], 'labels.parquet')
+    return (path, pointer['version']) if os.path.exists(path) else None
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    # Model dimuat sekali per proses dan dipakai bersama oleh semua sesi.
+    # Jika file model berubah di disk (mtime/ukuran) atau models/current.json menunjuk
+    # versi lain, model dimuat ulang otomatis.
+
+    def __init__(self, path=None):
+        self._path = path
+        self.path = path or resolve_path()
+        self._lock = threading.Lock()
+        self._model = None
+        self._stamp = None
+        self._info = {}
+
+    def _stat(self):
+        path = self._path or resolve_path()
+        stat = os.stat(path)
+        return path, stat.st_mtime_ns, stat.st_size
+
+    def _load(self, stamp):
+        # joblib (dan sklearn) baru diimpor saat model pertama kali dibutuhkan
+        import joblib
+
+        path = stamp[0]
+        model = joblib.load(path)
+        self.path = path
+        self._info = {
+            'path': path,
+            'model_class': type(model).__module__ + '.' + type(model).__name__,
+            'feature_names': [str(name) for name in getattr(model, 'feature_names_in_', [])],
+            'classes': [int(label) for label in getattr(model, 'classes_', [])],
+            'sha256': _file_hash(path),
+            'loaded_at': time.time(),
+        }
+        self._model = model
+        self._stamp = stamp
+
+    def get(self):
+        stamp = self._stat()
+        if self._model is None or stamp != self._stamp:
+            with self._lock:
+                if self._model is None or stamp != self._stamp:
+                    self._load(stamp)
+        return self._model
+
+    def info(self):
+        self.get()
+        return dict(self._info)
+
+    def version(self):
+        # Hash file model; berubah setiap kali model dimuat ulang
+        self.get()
+        return self._info['sha256']
+
+
+registry = ModelRegistry(MODEL_PATH)
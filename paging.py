@@ -0,0 +1,23 @@
+import numpy as np
+
+PAGE_SIZES = [25, 50, 100, 500]
+
+
+def page_count(total, page_size):
+    return max(1, -(-total // page_size))
+
+
+def paginate(frame, rows=None, page=1, page_size=PAGE_SIZES[0], sort_by=None, ascending=True):
+    # Ambil satu halaman dari frame; rows = posisi baris hasil filter (default: semua baris).
+    # Pengurutan dilakukan pada posisi baris saja, hanya baris di halaman ini yang disalin.
+    rows = np.arange(len(frame)) if rows is None else np.asarray(rows)
+    total = len(rows)
+
+    if sort_by is not None:
+        order = np.argsort(frame[sort_by].to_numpy()[rows], kind='stable')
+        rows = rows[order if ascending else order[::-1]]
+
+    pages = page_count(total, page_size)
+    page = min(max(int(page), 1), pages)
+    start = (page - 1) * page_size
+    return frame.iloc[rows[start:start + page_size]], total, pages
@@ -0,0 +1,148 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+import ispu
+
+# Urutan fitur yang dipakai model saat training
+FEATURES = ['stasiun', 'pm10', 'so2', 'co', 'o3', 'no2', 'max', 'critical', 'categori', 'year']
+
+# Kolom yang diisi pengguna; max, critical, dan categori selalu diturunkan dari polutan
+INPUTS = ['stasiun', 'pm10', 'so2', 'co', 'o3', 'no2', 'year']
+DERIVED = ['max', 'critical', 'categori']
+
+CHUNK_SIZE = 50_000
+
+# Presisi kunci cache: nilai polutan dibulatkan ke 3 desimal
+QUANTIZE_DECIMALS = 3
+
+# Hanya permintaan kecil (form, micro-batch API) yang melewati cache LRU per vektor: untuk
+# upload besar, membuat kunci per baris lebih mahal daripada predict_proba itu sendiri, dan
+# satu upload akan mengusir semua entri form dari LRU
+CACHE_MAX_ROWS = 1024
+
+
+class PredictionCache:
+    # Cache LRU probabilitas prediksi per vektor fitur, dipakai bersama oleh form dan API.
+    # Isi cache dikosongkan otomatis jika versi model berubah. Baris yang dikirim ke sini sudah
+    # unik (lihat predict_proba di bawah).
+
+    def __init__(self, max_size=100_000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    def predict_proba(self, model, features, version):
+        keys = list(features[FEATURES].round(QUANTIZE_DECIMALS).itertuples(index=False, name=None))
+        proba = np.empty((len(keys), len(model.classes_)))
+        missing = []
+
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            for i, key in enumerate(keys):
+                row = self._entries.get(key)
+                if row is None:
+                    missing.append(i)
+                else:
+                    self._entries.move_to_end(key)
+                    proba[i] = row
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if missing:
+            # Hanya baris yang belum ada di cache yang diprediksi, dalam satu panggilan
+            computed = model.predict_proba(features.iloc[missing])
+            proba[missing] = computed
+            with self._lock:
+                for i, row in zip(missing, computed):
+                    self._entries[keys[i]] = row
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return proba
+
+    def stats(self):
+        return {'size': len(self._entries), 'max_size': self.max_size, 'hits': self.hits, 'misses': self.misses}
+
+
+cache = PredictionCache()
+
+
+def _unique_rows(values):
+    # Kode grup per baris (baris identik = kode sama) dan posisi kemunculan pertama tiap kode
+    codes = values.groupby(list(values.columns), sort=False).ngroup().to_numpy()
+    _, first = np.unique(codes, return_index=True)
+    return codes, first
+
+
+def predict_proba(model, features, version=None):
+    # Baris duplikat dalam satu panggilan diprediksi sekali. Dengan versi model, vektor
+    # (dibulatkan ke QUANTIZE_DECIMALS) dicari di cache jika jumlah vektor uniknya kecil;
+    # tanpa versi model cache tidak dipakai dan nilai fitur tidak dibulatkan.
+    if len(features) <= 1:
+        if version is None or not len(features):
+            return model.predict_proba(features)
+        return cache.predict_proba(model, features, version)
+
+    keys = features[FEATURES] if version is None else features[FEATURES].round(QUANTIZE_DECIMALS)
+    codes, first = _unique_rows(keys)
+    unique = features.iloc[first]
+    if version is None or len(unique) > CACHE_MAX_ROWS:
+        proba = model.predict_proba(unique)
+    else:
+        proba = cache.predict_proba(model, unique, version)
+    return proba[codes]
+
+
+def read_upload(uploaded):
+    # File unggahan Streamlit: CSV atau Parquet berdasarkan ekstensi
+    if uploaded.name.lower().endswith('.parquet'):
+        return pd.read_parquet(uploaded)
+    return pd.read_csv(uploaded)
+
+
+def build_features(inputs):
+    # Fitur model dari kolom input. Kolom turunan dihitung ulang untuk semua baris sekaligus
+    # (ispu.derive), sehingga model selalu menerima max/critical/categori yang konsisten
+    # dengan nilai polutan, seperti pada data training.
+    inputs = inputs[INPUTS]
+    return inputs.join(ispu.derive(inputs))[FEATURES]
+
+
+def validate(frame):
+    # Pastikan semua kolom input ada dan bernilai numerik; kolom turunan yang ikut dikirim diabaikan
+    missing = [column for column in INPUTS if column not in frame.columns]
+    if missing:
+        raise ValueError('Kolom tidak ditemukan: ' + ', '.join(missing))
+
+    inputs = frame[INPUTS].apply(pd.to_numeric, errors='coerce')
+    invalid = inputs.columns[inputs.isna().any()].tolist()
+    if invalid:
+        raise ValueError('Kolom berisi nilai kosong/non-numerik: ' + ', '.join(invalid))
+    return build_features(inputs)
+
+
+def score_chunks(model, features, chunk_size=CHUNK_SIZE, version=None):
+    # Prediksi per potongan (chunk); satu panggilan predict_proba per chunk
+    classes = np.asarray(model.classes_)
+    for start in range(0, len(features), chunk_size):
+        chunk = features.iloc[start:start + chunk_size]
+        proba = predict_proba(model, chunk, version)
+        result = pd.DataFrame(proba, index=chunk.index, columns=[f'proba_{label}' for label in classes])
+        result.insert(0, 'cluster', classes[proba.argmax(axis=1)])
+        yield result
+
+
+def score(model, frame, chunk_size=CHUNK_SIZE, version=None):
+    features = validate(frame)
+    if features.empty:
+        return frame.assign(cluster=pd.Series(dtype='int64'))
+    scored = pd.concat(score_chunks(model, features, chunk_size, version))
+    # Hasil memuat kolom turunan yang benar-benar dipakai model
+    return frame.drop(columns=DERIVED + list(scored.columns), errors='ignore').join(features[DERIVED]).join(scored)
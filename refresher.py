@@ -0,0 +1,137 @@
+"""Penyegaran sumber data di latar belakang (stale-while-revalidate).
+
+Halaman selalu menyajikan salinan lokal terakhir tanpa menunggu jaringan. Sebuah
+thread latar belakang menjalankan event loop asyncio yang memeriksa ulang semua
+sumber di data_store.SOURCES secara bersamaan setiap AQ_REFRESH_INTERVAL detik,
+memakai satu sesi HTTP dengan connection pool, timeout per permintaan, dan
+retry dengan backoff. Data baru ditulis lewat data_store.store_payload (Parquet
+diganti secara atomik, lalu versinya), sehingga sesi berikutnya langsung memakai
+versi baru; jika gagal, salinan lama tetap dipakai.
+
+Untuk pengujian offline, arahkan AQ_SOURCE_URL ke server HTTP lokal:
+
+    python -m http.server -d fixtures/ 9000
+    AQ_SOURCE_URL=http://127.0.0.1:9000/ python refresher.py
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import data_store
+
+REFRESH_INTERVAL = float(os.environ.get('AQ_REFRESH_INTERVAL', 600))
+
+RETRIES = 3
+BACKOFF = 0.5
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _http():
+    # Satu requests.Session untuk semua sumber: koneksi keep-alive dipakai ulang antar penyegaran
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(4, len(data_store.SOURCES)))
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
+def _fetch(name, timeout):
+    # (isi, etag), atau None jika sumber tidak berubah (304)
+    response = _http().get(data_store.SOURCES[name], headers=data_store.conditional_headers(name),
+                           timeout=timeout)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    return response.content, response.headers.get('ETag')
+
+
+async def refresh(name, timeout=data_store.FETCH_TIMEOUT, retries=RETRIES):
+    # True jika salinan lokal diperbarui; galat terakhir dinaikkan setelah semua retry habis
+    for attempt in range(retries + 1):
+        try:
+            result = await asyncio.wait_for(asyncio.to_thread(_fetch, name, timeout), timeout * 2)
+            break
+        except (OSError, asyncio.TimeoutError):
+            # requests.RequestException adalah turunan OSError
+            if attempt == retries:
+                raise
+            await asyncio.sleep(BACKOFF * 2 ** attempt)
+    if result is None:
+        return False
+    return await asyncio.to_thread(data_store.store_payload, name, *result)
+
+
+async def refresh_all(timeout=data_store.FETCH_TIMEOUT, retries=RETRIES):
+    # Semua sumber sekaligus; hasil per sumber: True/False, atau exception jika gagal
+    names = list(data_store.SOURCES)
+    results = await asyncio.gather(*(refresh(name, timeout, retries) for name in names), return_exceptions=True)
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            print(f'refresh {name} gagal, salinan lokal tetap dipakai: {result!r}', file=sys.stderr)
+    return dict(zip(names, results))
+
+
+class Refresher:
+    # Thread daemon dengan event loop asyncio sendiri; dimulai sekali per proses
+
+    def __init__(self, interval=REFRESH_INTERVAL):
+        self.interval = interval
+        self.last_run = None
+        self.last_results = {}
+        self._thread = None
+        self._lock = threading.Lock()
+        # Diset setelah putaran pertama selesai (berhasil atau gagal untuk setiap sumber)
+        self._first_run = threading.Event()
+
+    def start(self):
+        if data_store.OFFLINE:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=asyncio.run, args=(self._run(),),
+                                                name='data-refresher', daemon=True)
+                self._thread.start()
+
+    def wait(self, name):
+        # Salinan lokal pertama: tunggu putaran pertama refresher alih-alih mengunduh sumber yang
+        # sama untuk kedua kalinya. Dengan AQ_OFFLINE tidak ada yang bisa ditunggu atau diunduh;
+        # tanpa thread (start() belum dipanggil) diunduh langsung. Putaran pertama dibatasi oleh
+        # timeout dan retry di refresh().
+        if data_store.OFFLINE:
+            raise FileNotFoundError(f"Salinan lokal '{name}' tidak ada di {data_store.DATA_DIR} dan AQ_OFFLINE=1: "
+                                    'jalankan sekali tanpa AQ_OFFLINE untuk mengunduhnya')
+        if self._thread is None:
+            data_store.refresh(name)
+            return
+        self._first_run.wait()
+        result = self.last_results.get(name)
+        if isinstance(result, BaseException) and not data_store.has_local(name):
+            raise result
+
+    async def _run(self):
+        while True:
+            self.last_results = await refresh_all()
+            self.last_run = time.time()
+            self._first_run.set()
+            await asyncio.sleep(self.interval)
+
+
+# Satu refresher untuk seluruh proses
+refresher = Refresher()
+
+
+if __name__ == '__main__':
+    # Satu putaran penyegaran dari baris perintah
+    for name, result in asyncio.run(refresh_all()).items():
+        print(f'{name}: {result}')
@@ -0,0 +1,85 @@
+"""Render PNG (matplotlib/seaborn) di process pool, di luar thread sesi Streamlit.
+
+``pool.submit(version, spec, func, *args)`` mengembalikan Future berisi bytes.
+``func`` harus fungsi level-modul (mis. ``figures.pollutant_correlation``) dan
+argumennya harus bisa di-pickle. Permintaan identik yang sedang berjalan
+memakai Future yang sama, sehingga banyak sesi yang membuka grafik yang sama
+hanya memicu satu render. Hasilnya disimpan di figure cache.
+
+AQ_RENDER_WORKERS mengatur jumlah proses (default: min(4, jumlah CPU));
+0 berarti render di satu thread latar belakang di proses ini.
+"""
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from figure_cache import cache as figure_cache
+
+RENDER_WORKERS = int(os.environ.get('AQ_RENDER_WORKERS', min(4, os.cpu_count() or 1)))
+
+
+class RenderPool:
+
+    def __init__(self, cache, workers=RENDER_WORKERS):
+        self.cache = cache
+        self.workers = workers
+        self._executor = None
+        self._inflight = {}
+        # RLock: callback selesai bisa langsung dipanggil di dalam submit jika task sudah selesai
+        self._lock = threading.RLock()
+        self.submitted = 0
+        self.deduplicated = 0
+
+    def _pool(self):
+        if self._executor is None:
+            if self.workers > 0:
+                # spawn: fork dari proses Streamlit yang multi-thread tidak aman
+                import multiprocessing
+
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context('spawn'))
+            else:
+                self._executor = ThreadPoolExecutor(1, thread_name_prefix='render')
+        return self._executor
+
+    def submit(self, version, spec, func, *args):
+        key = (version, spec)
+        with self._lock:
+            value = self.cache.get(version, spec)
+            if value is not None:
+                future = Future()
+                future.set_result(value)
+                return future
+            future = self._inflight.get(key)
+            if future is not None:
+                self.deduplicated += 1
+                return future
+            try:
+                future = self._pool().submit(func, *args)
+            except BrokenProcessPool:
+                # Proses worker mati (mis. kehabisan memori); buat pool baru
+                self._executor = None
+                future = self._pool().submit(func, *args)
+            self.submitted += 1
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+            return future
+
+    def _finish(self, key, future):
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(*key, future.result())
+        with self._lock:
+            self._inflight.pop(key, None)
+
+    def stats(self):
+        return {'workers': self.workers, 'inflight': len(self._inflight), 'submitted': self.submitted,
+                'deduplicated': self.deduplicated}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Satu pool untuk seluruh proses (dipakai bersama oleh semua sesi)
+pool = RenderPool(figure_cache)
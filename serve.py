@@ -0,0 +1,183 @@
+"""Mode deployment multi-proses: beberapa worker Streamlit di belakang load balancer lokal.
+
+    python serve.py --workers 16 --port 8501
+    python serve.py --workers 16 --no-balancer     # balancer di luar (mis. nginx ip_hash)
+
+Proses ini adalah loader: sumber data diambil sekali, disimpan sebagai file Arrow
+tanpa kompresi (data/<nama>.arrow), dan diperbarui setiap --refresh detik. Setiap
+worker berjalan dengan AQ_SHARED_DATA=1 dan AQ_OFFLINE=1, sehingga df/df2 dibaca
+lewat memory map dari file yang sama (satu salinan di page cache untuk semua
+worker) dan worker tidak pernah mengunduh sendiri. Label model yang dipromosikan
+train.py (labels.parquet) diterbitkan dengan cara yang sama ke data/labels.arrow.
+
+Load balancer meneruskan koneksi TCP ke worker berdasarkan alamat klien (sticky),
+karena state sesi Streamlit hanya ada di satu proses worker. Jika klien datang
+lewat reverse proxy lain, semua koneksi memiliki alamat yang sama; gunakan
+--no-balancer dan arahkan proxy tersebut ke port worker dengan sesi sticky.
+"""
+import argparse
+import asyncio
+import os
+import signal
+import subprocess
+import sys
+import zlib
+
+import data_store
+import refresher
+from model_registry import promoted_labels
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+
+
+async def load_all(publish_all=False):
+    # Perbarui semua salinan lokal secara bersamaan (bila online) lalu tulis ulang file Arrow
+    # yang berubah, termasuk label model yang baru dipromosikan; mengembalikan nama dataset
+    # yang berubah
+    results = {} if data_store.OFFLINE else await refresher.refresh_all()
+    changed = [name for name, result in results.items() if result is True]
+    for name in data_store.SOURCES:
+        if publish_all or name in changed:
+            await asyncio.to_thread(data_store.publish, name)
+    labels = promoted_labels()
+    if labels is not None and await asyncio.to_thread(data_store.publish_labels, *labels):
+        changed.append(data_store.LABELS)
+    return changed
+
+
+class Worker:
+    # Satu proses `streamlit run app.py` pada port lokal
+
+    def __init__(self, port, render_workers=1):
+        self.port = port
+        self.render_workers = render_workers
+        self.process = None
+        self.restarts = 0
+
+    def start(self):
+        # Proses render PNG per worker dibatasi: N worker x min(4, CPU) proses matplotlib akan
+        # menghabiskan memori yang dihemat oleh dataset bersama
+        env = dict(os.environ, AQ_SHARED_DATA='1', AQ_OFFLINE='1', AQ_DATA_DIR=data_store.DATA_DIR,
+                   AQ_RENDER_WORKERS=str(self.render_workers))
+        self.process = subprocess.Popen(
+            [sys.executable, '-m', 'streamlit', 'run', APP_PATH, '--server.port', str(self.port),
+             '--server.address', '127.0.0.1', '--server.headless', 'true'],
+            env=env, cwd=os.path.dirname(APP_PATH))
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if self.alive():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+
+async def _pipe(reader, writer):
+    try:
+        while True:
+            data = await reader.read(1 << 16)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+class Balancer:
+    # Proxy TCP: klien yang sama selalu diteruskan ke worker yang sama selama worker itu hidup
+
+    def __init__(self, workers):
+        self.workers = workers
+
+    def pick(self, host):
+        # Hash atas daftar worker yang tetap: worker lain yang mati atau hidup kembali tidak
+        # memindahkan klien ini. Hanya jika worker klien sendiri mati, dipilih worker lain yang hidup.
+        digest = zlib.crc32(host.encode())
+        worker = self.workers[digest % len(self.workers)]
+        if worker.alive():
+            return worker
+        alive = [worker for worker in self.workers if worker.alive()]
+        return alive[digest % len(alive)] if alive else worker
+
+    async def handle(self, reader, writer):
+        worker = self.pick(str(writer.get_extra_info('peername')[0]))
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection('127.0.0.1', worker.port)
+        except OSError:
+            writer.close()
+            return
+        await asyncio.gather(_pipe(reader, upstream_writer), _pipe(upstream_reader, writer))
+
+
+async def supervise(workers, interval=5.0):
+    # Jalankan ulang worker yang berhenti
+    while True:
+        await asyncio.sleep(interval)
+        for worker in workers:
+            if not worker.alive():
+                worker.restarts += 1
+                print(f'worker :{worker.port} berhenti, dijalankan ulang ({worker.restarts}x)', file=sys.stderr)
+                worker.start()
+
+
+async def refresh_loop(interval):
+    # Loader: hanya proses ini yang mengunduh; worker membaca file Arrow yang diganti secara atomik
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            changed = await load_all()
+        except OSError as e:
+            print(f'refresh gagal: {e}', file=sys.stderr)
+        else:
+            if changed:
+                print('dataset diperbarui: ' + ', '.join(changed), file=sys.stderr)
+
+
+async def run(args, workers):
+    tasks = [asyncio.create_task(supervise(workers)), asyncio.create_task(refresh_loop(args.refresh))]
+    if args.no_balancer:
+        print('worker: ' + ', '.join(f'127.0.0.1:{worker.port}' for worker in workers))
+        await asyncio.gather(*tasks)
+        return
+    server = await asyncio.start_server(Balancer(workers).handle, args.host, args.port)
+    print(f'load balancer di {args.host}:{args.port} -> {len(workers)} worker')
+    async with server:
+        await asyncio.gather(server.serve_forever(), *tasks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Jalankan beberapa worker Streamlit yang berbagi dataset')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8501)
+    parser.add_argument('--worker-port', type=int, default=8601, help='port worker pertama')
+    parser.add_argument('--refresh', type=float, default=600.0, help='interval refresh sumber data (detik)')
+    parser.add_argument('--no-balancer', action='store_true')
+    parser.add_argument('--render-workers', type=int, default=int(os.environ.get('AQ_RENDER_WORKERS', 1)),
+                        help='proses render PNG per worker (0 = thread di proses worker)')
+    args = parser.parse_args()
+
+    # SIGTERM (mis. dari systemd) menghentikan worker lewat blok finally di bawah
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    asyncio.run(load_all(publish_all=True))
+    workers = [Worker(args.worker_port + i, args.render_workers) for i in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        asyncio.run(run(args, workers))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for worker in workers:
+            worker.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Pencarian "hari serupa": station-day historis di df2 yang paling mirip dengan vektor polutan.
+
+Indeks KD-tree dibangun sekali per versi data atas nilai polutan yang distandardisasi
+(z-score per polutan, agar CO yang bernilai kecil tidak kalah oleh PM10), lalu dipakai
+bersama oleh semua sesi. Kueri selalu diproses per batch, sehingga banyak vektor
+(mis. file batch atau permintaan API) dicari dalam satu panggilan ke tree.
+
+    index = SimilarityIndex(df2)
+    index.neighbours(pd.DataFrame({'pm10': [60], 'so2': [30], ...}), k=5)
+"""
+import numpy as np
+
+from ispu import POLLUTANTS
+
+# Kolom yang ditampilkan untuk setiap tetangga
+RESULT_COLUMNS = ['stasiun', 'year', 'kmeans_label', *POLLUTANTS]
+
+CHUNK_SIZE = 10_000
+# Batas jumlah tetangga per kueri (API dan halaman)
+MAX_K = 100
+LEAF_SIZE = 40
+
+
+class SimilarityIndex:
+
+    def __init__(self, frame, leaf_size=LEAF_SIZE):
+        from sklearn.neighbors import KDTree
+
+        values = frame[POLLUTANTS].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(values).any(axis=1)
+        values = values[valid]
+        self.frame = frame
+        # Posisi baris frame untuk setiap titik di tree (baris dengan nilai kosong dilewati)
+        self.positions = np.flatnonzero(valid)
+        self.mean = values.mean(axis=0) if len(values) else np.zeros(len(POLLUTANTS))
+        std = values.std(axis=0) if len(values) else np.ones(len(POLLUTANTS))
+        self.scale = np.where(std > 0, std, 1.0)
+        self.tree = KDTree((values - self.mean) / self.scale, leaf_size=leaf_size)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def query(self, queries, k=5, chunk_size=CHUNK_SIZE):
+        # (jarak, posisi baris frame) berukuran len(queries) x k, terurut dari yang paling mirip
+        values = (queries[POLLUTANTS].to_numpy(dtype=np.float64) - self.mean) / self.scale
+        k = min(k, len(self))
+        distances = np.empty((len(values), k))
+        indices = np.empty((len(values), k), dtype=np.int64)
+        for start in range(0, len(values), chunk_size):
+            stop = start + chunk_size
+            distances[start:stop], indices[start:stop] = self.tree.query(values[start:stop], k=k)
+        return distances, self.positions[indices]
+
+    def neighbours(self, queries, k=5):
+        # Satu baris per (kueri, peringkat): nomor kueri, peringkat, jarak, dan kolom RESULT_COLUMNS
+        distances, rows = self.query(queries, k)
+        columns = [column for column in RESULT_COLUMNS if column in self.frame.columns]
+        result = self.frame.iloc[rows.ravel()][columns].reset_index(drop=True)
+        result.insert(0, 'query', np.repeat(np.arange(len(rows)), rows.shape[1]))
+        result.insert(1, 'rank', np.tile(np.arange(1, rows.shape[1] + 1), len(rows)))
+        result.insert(2, 'distance', distances.ravel())
+        return result
@@ -0,0 +1,37 @@
+"""Pengukuran anggaran waktu startup (cold start) aplikasi.
+
+Diimpor paling awal oleh app.py; setiap tahap dicatat sekali per proses lewat
+``mark``. ``importtime`` menjalankan ``python -X importtime`` di subprocess untuk
+melihat modul mana yang paling mahal diimpor.
+"""
+import os
+import subprocess
+import sys
+import time
+
+STARTED = time.perf_counter()
+
+_marks = {}
+
+
+def mark(name):
+    # Catat detik sejak proses memuat modul ini; hanya kejadian pertama yang disimpan
+    _marks.setdefault(name, time.perf_counter() - STARTED)
+
+
+def marks():
+    return dict(_marks)
+
+
+def importtime(modules, top=15):
+    # Ringkasan `python -X importtime`: (modul, self ms, kumulatif ms), urut dari kumulatif terbesar
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + ', '.join(modules)],
+                            capture_output=True, text=True, timeout=120,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return sorted(rows, key=lambda row: row[2], reverse=True)[:top]
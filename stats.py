@@ -0,0 +1,164 @@
+"""Akumulator statistik yang dapat diperbarui per baris dan digabung antar partisi.
+
+Korelasi polutan memakai mean dan co-moment gaya Welford (penggabungan paralel
+Chan et al.), sehingga heatmap untuk potongan tahun/stasiun mana pun cukup
+dihitung dari ringkasan per partisi, bukan dari seluruh baris data.
+"""
+import numpy as np
+import pandas as pd
+
+POLLUTANTS = ['max', 'pm10', 'so2', 'co', 'o3', 'no2']
+
+
+class Moments:
+    # Jumlah data, mean, dan co-moment sum((x - mean)(x - mean)^T)
+
+    def __init__(self, dim=len(POLLUTANTS)):
+        self.n = 0
+        self.mean = np.zeros(dim)
+        self.comoment = np.zeros((dim, dim))
+
+    def update(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.comoment += np.outer(delta, x - self.mean)
+        return self
+
+    def update_batch(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return self
+        batch = Moments(values.shape[1])
+        batch.n = len(values)
+        batch.mean = values.mean(axis=0)
+        centered = values - batch.mean
+        batch.comoment = centered.T @ centered
+        return self.merge(batch)
+
+    def merge(self, other):
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean = self.mean + delta * (other.n / n)
+        self.n = n
+        return self
+
+    def covariance(self):
+        # Kurang dari dua data (mis. potongan kosong): kovarians tidak terdefinisi
+        if self.n < 2:
+            return np.full(self.comoment.shape, np.nan)
+        return self.comoment / (self.n - 1)
+
+    def correlation(self):
+        # Kolom konstan (std 0) tidak memiliki korelasi, sama seperti DataFrame.corr()
+        cov = self.covariance()
+        std = np.sqrt(np.clip(np.diag(cov), 0, None))
+        scale = np.outer(std, std)
+        return np.divide(cov, scale, out=np.full(cov.shape, np.nan), where=scale > 0)
+
+    def to_dict(self):
+        return {'n': self.n, 'mean': self.mean.tolist(), 'comoment': self.comoment.tolist()}
+
+    @classmethod
+    def from_dict(cls, data):
+        moments = cls(len(data['mean']))
+        moments.n = data['n']
+        moments.mean = np.asarray(data['mean'], dtype=np.float64)
+        moments.comoment = np.asarray(data['comoment'], dtype=np.float64)
+        return moments
+
+
+class Histogram:
+    # Jumlah kemunculan tiap kode (categori / critical)
+
+    def __init__(self, counts=None):
+        self.counts = dict(counts or {})
+
+    def update(self, value):
+        self.counts[int(value)] = self.counts.get(int(value), 0) + 1
+        return self
+
+    def update_batch(self, values):
+        codes, counts = np.unique(np.asarray(values), return_counts=True)
+        for code, count in zip(codes.tolist(), counts.tolist()):
+            self.counts[int(code)] = self.counts.get(int(code), 0) + count
+        return self
+
+    def merge(self, other):
+        for code, count in other.counts.items():
+            self.counts[code] = self.counts.get(code, 0) + count
+        return self
+
+    def as_series(self):
+        return pd.Series(self.counts, dtype='int64').sort_index()
+
+    def to_dict(self):
+        return {str(code): count for code, count in self.counts.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls({int(code): count for code, count in data.items()})
+
+
+class PartitionStats:
+    # Ringkasan satu partisi (year, stasiun): histogram categori & critical dan momen polutan
+
+    def __init__(self):
+        self.rows = 0
+        self.categori = Histogram()
+        self.critical = Histogram()
+        self.moments = Moments()
+
+    @classmethod
+    def from_frame(cls, frame):
+        stats = cls()
+        stats.rows = int(len(frame))
+        stats.categori.update_batch(frame['categori'].to_numpy())
+        stats.critical.update_batch(frame['critical'].to_numpy())
+        stats.moments.update_batch(frame[POLLUTANTS].dropna().to_numpy())
+        return stats
+
+    def update(self, row):
+        # Perbarui dengan satu bacaan (dict/Series berisi kolom polutan, categori, critical)
+        self.rows += 1
+        self.categori.update(row['categori'])
+        self.critical.update(row['critical'])
+        values = np.asarray([row[column] for column in POLLUTANTS], dtype=np.float64)
+        if not np.isnan(values).any():
+            self.moments.update(values)
+        return self
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.categori.merge(other.categori)
+        self.critical.merge(other.critical)
+        self.moments.merge(other.moments)
+        return self
+
+    def correlation(self):
+        return pd.DataFrame(self.moments.correlation(), index=POLLUTANTS, columns=POLLUTANTS)
+
+    def to_dict(self):
+        return {'rows': self.rows, 'categori': self.categori.to_dict(), 'critical': self.critical.to_dict(),
+                'moments': self.moments.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.rows = data['rows']
+        stats.categori = Histogram.from_dict(data['categori'])
+        stats.critical = Histogram.from_dict(data['critical'])
+        stats.moments = Moments.from_dict(data['moments'])
+        return stats
+
+
+def combine(parts):
+    # Gabungkan banyak ringkasan partisi menjadi satu (O(jumlah partisi))
+    result = PartitionStats()
+    for part in parts:
+        result.merge(part)
+    return result
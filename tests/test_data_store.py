@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import data_store
+
+KEYS = ['year', 'stasiun', 'categori']
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        'year': rng.choice([2019, 2020, 2021], 400),
+        'stasiun': rng.integers(0, 5, 400),
+        'categori': rng.integers(0, 4, 400),
+        'pm10': rng.gamma(2.0, 20.0, 400),
+    })
+
+
+@pytest.mark.parametrize('selection', [
+    {},
+    {'year': [2020]},
+    {'year': [2019, 2021], 'stasiun': [0, 3]},
+    {'stasiun': [4], 'categori': [1, 2]},
+    {'year': []},
+    {'year': [2030]},
+])
+def test_rows_and_count_match_boolean_mask(frame, selection):
+    index = data_store.FrameIndex(frame, KEYS)
+    mask = np.ones(len(index.frame), dtype=bool)
+    for key, values in selection.items():
+        mask &= index.frame[key].isin(values).to_numpy()
+
+    rows = index.rows(**selection)
+    assert index.count(**selection) == mask.sum()
+    np.testing.assert_array_equal(np.sort(rows), np.flatnonzero(mask))
+    pd.testing.assert_frame_equal(index.select(**selection).reset_index(drop=True),
+                                  index.frame[mask].reset_index(drop=True))
+
+
+def test_sorted_frame_is_not_copied(frame):
+    ordered = frame.sort_values(KEYS, kind='stable', ignore_index=True)
+    assert data_store.FrameIndex(ordered, KEYS).frame is ordered
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import ispu
+
+
+@pytest.mark.parametrize('value, category', [
+    (0, 0), (50, 0), (50.5, 1), (51, 1), (100, 1), (101, 2), (199, 2), (200, 3), (299, 3), (300, 4), (1000, 4),
+])
+def test_ispu_breakpoints_are_inclusive_upper_bounds(value, category):
+    assert ispu.ispu_category([value])[0] == category
+    assert ispu.ISPU_LABELS[category]
+
+
+@pytest.mark.parametrize('pollutant', ispu.POLLUTANTS)
+def test_aqi_breakpoints(pollutant):
+    bounds = ispu.AQI_BOUNDS[pollutant]
+    edges = ispu.aqi_category(pollutant, bounds)
+    above = ispu.aqi_category(pollutant, bounds + 0.01)
+    np.testing.assert_array_equal(edges, np.arange(len(bounds)))
+    np.testing.assert_array_equal(above, np.arange(1, len(bounds) + 1))
+    assert len(ispu.AQI_LABELS) == len(bounds) + 1
+
+
+def test_derive():
+    frame = pd.DataFrame({'pm10': [50, 10, 120, 80], 'so2': [20, 10, 30, 80], 'co': [10, 300, 5, 1],
+                          'o3': [30, 10, 199, 2], 'no2': [40, 10, 20, 3]}, index=[7, 8, 9, 10])
+    derived = ispu.derive(frame)
+    assert derived.index.tolist() == [7, 8, 9, 10]
+    assert derived['max'].tolist() == [50, 300, 199, 80]
+    # Nilai tertinggi yang sama: kode polutan pertama (pm10) dipakai
+    assert derived['critical'].tolist() == [0, 2, 3, 0]
+    assert derived['categori'].tolist() == [0, 4, 2, 1]
+
+
+def test_derive_empty():
+    derived = ispu.derive(pd.DataFrame(columns=ispu.POLLUTANTS, dtype=float))
+    assert len(derived) == 0
+    assert list(derived.columns) == ['max', 'critical', 'categori']
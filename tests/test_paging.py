@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import paging
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({'value': np.arange(60)[::-1], 'label': [f'r{i}' for i in range(60)]})
+
+
+def test_page_count():
+    assert paging.page_count(0, 25) == 1
+    assert paging.page_count(25, 25) == 1
+    assert paging.page_count(26, 25) == 2
+
+
+def test_pages_cover_all_rows(frame):
+    pages = [paging.paginate(frame, page=page, page_size=25) for page in (1, 2, 3)]
+    assert [len(page) for page, _, _ in pages] == [25, 25, 10]
+    assert all(total == 60 and count == 3 for _, total, count in pages)
+    pd.testing.assert_frame_equal(pd.concat([page for page, _, _ in pages]), frame)
+
+
+def test_page_is_clamped(frame):
+    assert paging.paginate(frame, page=99, page_size=25)[0].index.tolist() == list(range(50, 60))
+    assert paging.paginate(frame, page=0, page_size=25)[0].index.tolist() == list(range(25))
+
+
+def test_rows_and_sort(frame):
+    rows = np.arange(0, 60, 2)
+    page, total, pages = paging.paginate(frame, rows, page=1, page_size=10, sort_by='value')
+    assert (total, pages) == (30, 3)
+    assert page['value'].tolist() == sorted(frame['value'].iloc[rows])[:10]
+
+    page, _, _ = paging.paginate(frame, rows, page=1, page_size=10, sort_by='value', ascending=False)
+    assert page['value'].tolist() == sorted(frame['value'].iloc[rows], reverse=True)[:10]
+
+
+def test_empty_selection(frame):
+    page, total, pages = paging.paginate(frame, np.array([], dtype=np.int64))
+    assert (len(page), total, pages) == (0, 0, 1)
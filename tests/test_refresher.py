@@ -0,0 +1,122 @@
+"""Refresher terhadap server HTTP lokal (pengganti GitHub), tanpa koneksi jaringan."""
+import asyncio
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import data_store
+import refresher
+
+CSV = b'stasiun,pm10,so2,co,o3,no2,max,critical,categori,year\n0,10,20,30,40,50,50,4,0,2020\n'
+
+
+class Source(BaseHTTPRequestHandler):
+    # Sumber dengan ETag: 304 jika If-None-Match cocok; '/hang' tidak pernah menjawab tepat waktu
+    files = {}
+    log = []
+
+    def do_GET(self):
+        self.log.append((self.path, self.headers.get('If-None-Match')))
+        if self.path == '/hang':
+            time.sleep(2)
+            return
+        body = self.files[self.path]
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    Source.files = {'/cleaned.csv': CSV}
+    Source.log = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Source)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    monkeypatch.setattr(data_store, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(data_store, 'SOURCES', {'cleaned': base + '/cleaned.csv', 'kmeans': base + '/hang'})
+    monkeypatch.setattr(refresher, 'BACKOFF', 0.01)
+    yield Source
+    server.shutdown()
+    server.server_close()
+
+
+def refresh(name, **kwargs):
+    return asyncio.run(refresher.refresh(name, **kwargs))
+
+
+def test_change_is_picked_up(source):
+    assert refresh('cleaned') is True
+    first = data_store.version('cleaned')
+    assert len(data_store.load('cleaned', fetch=False)) == 1
+
+    source.files['/cleaned.csv'] = CSV + b'1,11,21,31,41,51,51,4,0,2021\n'
+    assert refresh('cleaned') is True
+    assert data_store.version('cleaned') != first
+    assert len(data_store.load('cleaned', fetch=False)) == 2
+
+
+def test_not_modified(source):
+    assert refresh('cleaned') is True
+    version = data_store.version('cleaned')
+
+    assert refresh('cleaned') is False
+    # Permintaan kedua mengirim ETag yang tersimpan dan dijawab 304
+    assert source.log[-1][1] is not None
+    assert data_store.version('cleaned') == version
+
+
+def test_timeout_is_retried_then_raised(source):
+    start = time.perf_counter()
+    with pytest.raises((OSError, asyncio.TimeoutError)):
+        refresh('kmeans', timeout=0.2, retries=2)
+    assert [path for path, _ in source.log] == ['/hang'] * 3
+    assert time.perf_counter() - start < 2
+    assert not data_store.has_local('kmeans')
+
+
+def test_refresh_all_keeps_local_copy_on_failure(source):
+    results = asyncio.run(refresher.refresh_all(timeout=0.2, retries=0))
+    assert results['cleaned'] is True
+    assert isinstance(results['kmeans'], BaseException)
+    assert data_store.has_local('cleaned')
+
+
+def test_cold_start_waits_for_first_round(source, monkeypatch):
+    monkeypatch.setattr(data_store, 'OFFLINE', False)
+    monkeypatch.setattr(data_store, 'SOURCES', {'cleaned': data_store.SOURCES['cleaned']})
+    background = refresher.Refresher(interval=3600)
+    background.start()
+
+    # Sesi-sesi pertama menunggu putaran pertama refresher, tanpa unduhan kedua
+    threads = [threading.Thread(target=background.wait, args=('cleaned',)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    assert data_store.has_local('cleaned')
+    assert [path for path, _ in source.log] == ['/cleaned.csv']
+
+
+def test_offline_wait_without_local_copy_raises(source, monkeypatch):
+    monkeypatch.setattr(data_store, 'OFFLINE', True)
+    background = refresher.Refresher(interval=3600)
+    background.start()
+
+    with pytest.raises(FileNotFoundError, match='AQ_OFFLINE'):
+        background.wait('cleaned')
+    assert source.log == []
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import stats
+
+
+@pytest.fixture
+def readings():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.gamma(2.0, 20.0, size=(500, len(stats.POLLUTANTS))), columns=stats.POLLUTANTS)
+    frame['co'] += 0.5 * frame['pm10']
+    return frame
+
+
+def test_merged_moments_match_pandas(readings):
+    # Ringkasan per potongan (batch, baris tunggal, dan kosong) digabung = korelasi seluruh data
+    parts = [stats.Moments().update_batch(readings[:200].to_numpy()),
+             stats.Moments().update_batch(readings[200:0].to_numpy())]
+    single = stats.Moments()
+    for row in readings[200:260].to_numpy():
+        single.update(row)
+    parts.append(single)
+    parts.append(stats.Moments().update_batch(readings[260:].to_numpy()))
+
+    merged = stats.Moments()
+    for part in parts:
+        merged.merge(part)
+    assert merged.n == len(readings)
+    np.testing.assert_allclose(merged.correlation(), readings.corr().to_numpy())
+    np.testing.assert_allclose(merged.covariance(), readings.cov().to_numpy())
+
+
+def test_round_trip_through_dict(readings):
+    part = stats.PartitionStats.from_frame(readings.assign(categori=1, critical=0))
+    restored = stats.PartitionStats.from_dict(part.to_dict())
+    pd.testing.assert_frame_equal(restored.correlation(), part.correlation())
+    assert restored.categori.counts == {1: len(readings)}
+
+
+@pytest.mark.parametrize('rows', [0, 1])
+def test_undefined_correlation_is_nan(readings, rows):
+    moments = stats.Moments().update_batch(readings[:rows].to_numpy())
+    with np.errstate(all='raise'):
+        assert np.isnan(moments.correlation()).all()
+
+
+def test_constant_column_is_nan(readings):
+    values = readings.assign(so2=7.0)
+    moments = stats.Moments().update_batch(values.to_numpy())
+    expected = values.corr().to_numpy()
+    np.testing.assert_array_equal(np.isnan(moments.correlation()), np.isnan(expected))
+    np.testing.assert_allclose(moments.correlation(), expected)
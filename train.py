@@ -0,0 +1,203 @@
+"""Latih ulang klastering dan classifier label dari data lokal.
+
+    python train.py                          # data: partisi ingesti jika ada, jika tidak data store 'cleaned'
+    python train.py --clusters 6 --n-init 8 --jobs -1
+    python train.py --classifier knn --no-promote
+
+Langkah:
+1. MiniBatchKMeans pada fitur yang distandardisasi; n_init dijalankan paralel
+   (satu fit per seed di setiap core) dan hasil dengan inertia terkecil dipakai.
+2. Nomor klaster disejajarkan dengan label yang sedang dipakai aplikasi
+   (pencocokan centroid), sehingga "Klaster N" tetap bermakna sama antar pelatihan.
+3. Classifier label dilatih pada prediction.FEATURES dan dievaluasi pada data uji.
+
+Artefak ditulis ke models/<versi>/: classifier.sav, labels.parquet (data
+training + kmeans_label), dan metrics.json (metrik dan waktu tiap langkah).
+models/current.json lalu diarahkan ke versi baru. Aplikasi dan API memakai
+keduanya pada permintaan berikutnya: ModelRegistry memuat classifier, dan
+labels.parquet menggantikan df2, sehingga visualisasi klaster, catatan klaster,
+dan hari serupa memakai label yang sama dengan classifier. AQ_MODEL_PATH
+menonaktifkan keduanya (hanya file model itu yang dipakai, dengan df2 asli).
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+import data_store
+import ingest
+import prediction
+from model_registry import MODEL_DIR, POINTER_PATH, promoted_labels
+
+
+def training_data():
+    # Semua bacaan yang tersedia: partisi ingesti (data baru setelah 2021) atau data store 'cleaned'
+    if ingest.has_partitions():
+        frame = ingest.load_readings()
+    else:
+        frame = data_store.load('cleaned')
+    return prediction.validate(frame.dropna(subset=prediction.INPUTS))
+
+
+def reference_labels():
+    # Label yang sedang dipakai aplikasi: model yang dipromosikan sebelumnya, atau df2 asli
+    labels = promoted_labels()
+    return data_store.load_labels(*labels) if labels else data_store.load('kmeans')
+
+
+def _fit_kmeans(values, clusters, seed, batch_size):
+    from sklearn.cluster import MiniBatchKMeans
+
+    return MiniBatchKMeans(n_clusters=clusters, n_init=1, batch_size=batch_size, random_state=seed).fit(values)
+
+
+def fit_clusters(values, clusters, n_init, jobs, batch_size, seed=0):
+    # n_init fit independen secara paralel; yang terbaik (inertia terkecil) dipilih
+    from joblib import Parallel, delayed
+
+    fits = Parallel(n_jobs=jobs, prefer='processes')(
+        delayed(_fit_kmeans)(values, clusters, seed + i, batch_size) for i in range(n_init))
+    return min(fits, key=lambda fit: fit.inertia_)
+
+
+def align_labels(centers, reference):
+    # Pemetaan klaster baru -> kmeans_label lama dengan jarak centroid total terkecil (Hungarian).
+    # Klaster tanpa pasangan (jumlah klaster berbeda) diberi nomor baru setelah label lama.
+    from scipy.optimize import linear_sum_assignment
+
+    distance = np.linalg.norm(centers[:, None, :] - reference.to_numpy()[None, :, :], axis=2)
+    rows, cols = linear_sum_assignment(distance)
+    mapping = {int(row): int(reference.index[col]) for row, col in zip(rows, cols)}
+    next_label = int(reference.index.max()) + 1 if len(reference) else 0
+    for row in range(len(centers)):
+        if row not in mapping:
+            mapping[row] = next_label
+            next_label += 1
+    return mapping
+
+
+def make_classifier(kind):
+    # Fitur distandardisasi di dalam pipeline, sehingga model menerima nilai mentah seperti knn.sav
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    if kind == 'knn':
+        from sklearn.neighbors import KNeighborsClassifier
+
+        return make_pipeline(StandardScaler(), KNeighborsClassifier(n_neighbors=5))
+    from sklearn.linear_model import LogisticRegression
+
+    return make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000))
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def promote(version):
+    # Arahkan models/current.json ke versi ini secara atomik
+    tmp = POINTER_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'version': version, 'model': os.path.join(version, 'classifier.sav'), 'promoted_at': time.time()},
+                  f, indent=2)
+    os.replace(tmp, POINTER_PATH)
+
+
+def train(clusters=None, n_init=8, jobs=-1, batch_size=4096, classifier='logistic', test_size=0.2, seed=0):
+    import joblib
+    from sklearn.metrics import accuracy_score, f1_score, silhouette_score
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+
+    timings = {}
+
+    start = time.perf_counter()
+    features = training_data()
+    reference_data = reference_labels()
+    clusters = clusters or int(reference_data['kmeans_label'].nunique())
+    timings['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scaler = StandardScaler().fit(features)
+    values = scaler.transform(features)
+    kmeans = fit_clusters(values, clusters, n_init, jobs, batch_size, seed)
+    timings['cluster'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference_features = prediction.validate(reference_data)
+    reference = pd.DataFrame(scaler.transform(reference_features), index=reference_data.index).groupby(
+        reference_data['kmeans_label'].to_numpy()).mean()
+    mapping = align_labels(kmeans.cluster_centers_, reference)
+    labels = np.vectorize(mapping.get)(kmeans.labels_)
+    timings['align'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    train_x, test_x, train_y, test_y = train_test_split(features, labels, test_size=test_size, random_state=seed,
+                                                        stratify=labels if np.bincount(labels).min() > 1 else None)
+    model = make_classifier(classifier).fit(train_x, train_y)
+    predicted = model.predict(test_x)
+    timings['classifier'] = time.perf_counter() - start
+
+    sample = np.random.default_rng(seed).choice(len(values), size=min(len(values), 10_000), replace=False)
+    metrics = {
+        'rows': int(len(features)),
+        'clusters': int(clusters),
+        'inertia': float(kmeans.inertia_),
+        'silhouette': float(silhouette_score(values[sample], labels[sample])) if clusters > 1 else None,
+        'cluster_sizes': {str(label): int(count) for label, count in zip(*np.unique(labels, return_counts=True))},
+        'label_mapping': {str(raw): label for raw, label in mapping.items()},
+        'classifier': type(model[-1]).__name__,
+        'accuracy': float(accuracy_score(test_y, predicted)),
+        'f1_macro': float(f1_score(test_y, predicted, average='macro')),
+    }
+
+    version = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())
+    directory = os.path.join(MODEL_DIR, version)
+    os.makedirs(directory, exist_ok=True)
+    start = time.perf_counter()
+    joblib.dump(model, os.path.join(directory, 'classifier.sav'))
+    features.assign(kmeans_label=labels).to_parquet(os.path.join(directory, 'labels.parquet'), index=False)
+    timings['write'] = time.perf_counter() - start
+
+    report = {
+        'version': version,
+        'created_at': time.time(),
+        'params': {'n_init': n_init, 'jobs': jobs, 'batch_size': batch_size, 'test_size': test_size, 'seed': seed},
+        'metrics': metrics,
+        'timings': timings,
+        'classifier_sha256': _file_hash(os.path.join(directory, 'classifier.sav')),
+    }
+    with open(os.path.join(directory, 'metrics.json'), 'w') as f:
+        json.dump(report, f, indent=2)
+    return version, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Latih ulang MiniBatchKMeans dan classifier label')
+    parser.add_argument('--clusters', type=int, help="jumlah klaster (default: sama dengan data store 'kmeans')")
+    parser.add_argument('--n-init', type=int, default=8)
+    parser.add_argument('--jobs', type=int, default=-1, help='jumlah proses untuk n_init (-1 = semua core)')
+    parser.add_argument('--batch-size', type=int, default=4096)
+    parser.add_argument('--classifier', choices=['logistic', 'knn'], default='logistic')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-promote', action='store_true', help='tulis artefak tanpa mengganti model aktif')
+    args = parser.parse_args()
+
+    version, report = train(args.clusters, args.n_init, args.jobs, args.batch_size, args.classifier, seed=args.seed)
+    if not args.no_promote:
+        promote(version)
+    metrics = report['metrics']
+    print(f"{version}: {metrics['rows']} baris, {metrics['clusters']} klaster, "
+          f"akurasi {metrics['accuracy']:.3f}, F1 {metrics['f1_macro']:.3f}")
+    print(', '.join(f'{stage} {seconds:.2f} s' for stage, seconds in report['timings'].items()))
+    if not args.no_promote:
+        print(f'model aktif: {os.path.join(MODEL_DIR, version)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Sumber daya bersama untuk semua halaman.
+
+Fungsi cache di sini (st.cache_data / st.cache_resource) hidup selama proses,
+sehingga data store, registry model, dan figure cache dipakai bersama oleh semua sesi.
+"""
+import streamlit as st
+
+import data_store
+import instrument
+import paging
+from model_registry import promoted_labels
+from refresher import refresher
+
+# Batas cache turunan per versi data (indeks, profil, agregat): versi aktif dan satu versi
+# sebelumnya, untuk sesi yang masih berjalan saat refresher menukar data. Setiap entri memegang
+# referensi ke frame-nya, jadi tanpa batas semua versi yang pernah disajikan tetap di memori.
+DERIVED_CACHE_ENTRIES = 2
+
+
+# Load data
+# Data disimpan lokal (Parquet) dan hanya diunduh ulang jika sumber berubah.
+# Data dimuat saat pertama kali dibutuhkan oleh halaman:
+# 'cleaned' = Without K-Means Label (df), 'kmeans' = With K-Means Label (df2)
+# cache_resource: satu DataFrame per proses dipakai bersama oleh semua sesi (cache_data
+# akan membuat salinan baru di setiap rerun). Halaman tidak boleh mengubah frame ini.
+@st.cache_resource(max_entries=4, show_spinner=False)
+def cached_data(name, version, labels_path=None):
+    if labels_path is not None:
+        return data_store.load_labels(labels_path, version)
+    return data_store.load(name, fetch=False)
+
+
+# Stale-while-revalidate: salinan lokal terakhir langsung disajikan, sumber diperiksa ulang
+# di latar belakang (refresher.py). Kunci cache adalah versi data, jadi versi baru langsung
+# terpakai begitu refresher selesai menulisnya. Hanya jika belum ada salinan lokal sama sekali,
+# halaman (dan sesi lain yang datang bersamaan) menunggu putaran pertama refresher.
+@instrument.timed('data_fetch')
+def load_data(name):
+    refresher.start()
+    # df2 memakai label model yang dipromosikan train.py (jika ada), lihat model_registry.promoted_labels
+    labels = promoted_labels() if name == 'kmeans' else None
+    if labels is not None:
+        return cached_data(name, labels[1], labels[0])
+    if not data_store.has_local(name) and not data_store.SHARED:
+        refresher.wait(name)
+    return cached_data(name, data_store.version(name))
+
+
+# Tabel per halaman: hanya satu halaman yang dikirim ke browser
+def show_table(frame, rows, key, column_order=None):
+    columns = column_order or list(frame.columns)
+    col1, col2, col3, col4 = st.columns(4)
+    sort_by = col1.selectbox('Urutkan berdasarkan', ['-'] + columns, key=f'{key}_sort')
+    ascending = col2.selectbox('Urutan', ['Naik', 'Turun'], key=f'{key}_order') == 'Naik'
+    page_size = col3.selectbox('Baris per halaman', paging.PAGE_SIZES, key=f'{key}_size')
+    pages = paging.page_count(len(rows), page_size)
+    page = col4.number_input('Halaman', min_value=1, max_value=pages, value=1, key=f'{key}_page_{pages}')
+
+    with instrument.stage('paging'):
+        page_df, total, pages = paging.paginate(frame, rows, page, page_size,
+                                                sort_by=None if sort_by == '-' else sort_by, ascending=ascending)
+    with instrument.stage('table_serialize'):
+        st.dataframe(page_df, column_order=column_order, hide_index=True)
+    st.caption(f'Halaman {page} dari {pages} ({total} baris)')
+
+
+# Kirim spesifikasi Plotly ke browser; serialisasi dicatat sebagai tahap tersendiri
+def plotly_chart(spec):
+    with instrument.stage('chart_serialize'):
+        st.plotly_chart(spec)
@@ -0,0 +1,97 @@
+import streamlit as st
+
+import data_store
+import instrument
+from views.common import DERIVED_CACHE_ENTRIES, load_data, show_table
+
+
+# Indeks year -> stasiun -> categori untuk filter Dasbor
+@st.cache_resource(max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def dasbor_index(_frame, version):
+    return data_store.FrameIndex(_frame, ['year', 'stasiun', 'categori'])
+
+
+# Dashboard Main Panel
+def render():
+    # Filter memakai indeks year -> stasiun -> categori, bukan memindai seluruh df
+    df = load_data('cleaned')
+    with instrument.stage('filter'):
+        index = dasbor_index(df, data_store.frame_version(df))
+    year_list = index.values('year')
+    selected_year = st.sidebar.selectbox('Pilih Tahun', year_list)
+
+    st.markdown("<h1 style='text-align: center;'>Analisis Kualitas Udara DKI Jakarta pada Tahun 2019 - 2021</h1>", unsafe_allow_html=True)
+
+    st.markdown("""
+    <div style='text-align: justify;'>
+        <h3>Jelajahi Data Kualitas Udara</h3>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Menampilkan gambar di dashboard
+    st.image('https://awsimages.detik.net.id/community/media/visual/2023/05/29/penyebab-polusi-udara-dan-cara-cara-pencegahannya_169.jpeg?w=600&q=90', caption='Polusi ', use_column_width=True)
+    
+    st.markdown("""
+    <div style='text-align: justify;'>
+        <p>Gunakan menu dropdown di sidebar untuk memilih tahun yang ingin ditampilkan data kualitas udaranya.
+        Data ini mencakup parameter polusi yang diukur (pm10, so2, co, o3, no2), parameter polusi yang memiliki skor pengukuran tertinggi (max & critical), 
+        lokasi stasiun pengukuran (stasiun), dan kategori kualitas udara (categori).</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Daftar stasiun yang tersedia secara terurut
+    station_options = index.values('stasiun', year=[selected_year])
+
+    # Daftar kategori yang tersedia secara terurut
+    category_options = index.values('categori', year=[selected_year])
+
+    # Multiselect untuk memilih stasiun
+    selected_stations = st.multiselect('Pilih Stasiun', options=station_options, default=station_options)
+    st.caption('Stasiun: 0 = DKI1 (Bunderan HI), 1 = DKI2 (Kelapa Gading), 2 = DKI3 (Jagakarsa), 3 = DKI4 (Lubang Buaya), dan 4 = DKI5 (Kebon Jeruk).')
+
+    # Multiselect untuk memilih kategori
+    selected_categories = st.multiselect('Pilih Kategori', options=category_options, default=category_options)
+    st.caption('Kategori: 0 = baik, 1 = sedang, 2 = tidak sehat, dan 3 = sangat tidak sehat.')
+
+    # Filter DataFrame berdasarkan stasiun dan kategori yang dipilih
+    selection = {'year': [selected_year], 'stasiun': selected_stations, 'categori': selected_categories}
+    with instrument.stage('filter'):
+        filtered_rows = index.rows(**selection)
+        count = index.count(**selection)
+    
+    # Tampilkan jumlah data
+    st.write("Jumlah data:", count)
+
+    # Tampilkan DataFrame yang telah difilter (per halaman)
+    show_table(index.frame, filtered_rows, 'dasbor',
+               column_order=["stasiun", "pm10", "so2", "co", "o3", "no2", "max", "critical", "categori"])
+    
+    st.caption('Critical: 0 = pm10, 1 = so2, 2 = co, 3 = o3, dan 4 = no2.')
+
+    st.markdown("""
+    <div style='text-align: justify;'>
+        <h3>Memahami Data</h3>
+        
+        - Stasiun: Kolom ini berisi nama/lokasi pengukuran kualitas udara. 0 merepresentasikan DKI1 (Bunderan HI), 1 merepresentasikan DKI2 (Kelapa Gading),
+                   2 merepresentasikan DKI3 (Jagakarsa), 3 merepresentasikan DKI4 (Lubang Buaya), dan 4 merepresentasikan DKI5 (Kebon Jeruk).
+                
+        - pm10: Kolom ini berisi partikulat materi dengan diameter < 10 mikrometer, salah satu parameter polusi yang diukur dalam pengukuran kualitas udara
+                
+        - so2: Kolom ini berisi kadar sulfur dioksida (SO2), salah satu parameter polusi yang diukur dalam pengukuran kualitas udara 
+                
+        - co: Kolom ini berisi kadar karbon dioksida (CO), salah satu parameter polusi yang diukur dalam pengukuran kualitas udara
+
+        - o3: Kolom ini berisi kadar ozon (O3), salah satu parameter yang diukur dalam pengukuran kualitas udara
+                
+        - no2: Kolom ini berisi kadar nitrogen dioksida (NO2), salah satu parameter polusi yang diukur dalam pengukuran kualitas udara
+                
+        - max: Kolom ini berisi nilai tertinggi di antara semua parameter dalam pengukuran kualitas udara
+                
+        - critical: Kolom ini berisi nama parameter yang memiliki nilai tertinggi di antara semua parameter dalam pengukuran kualitas udara.
+                    0 merepresentasikan PM10, 1 merepresentasikan SO2, 2 merepresentasikan CO, 3 merepresentasikan O3, dan 4 merepresentasikan NO2.
+                
+        - categori: Kolom ini berisi kategori kualitas udara berdasarkan Indeks Standar Polusi Udara dalam pengukuran kualitas udara.
+                    0 merepresentasikan baik, 1 merepresentasikan sedang, 2 merepresentasikan tidak sehat, 3 merepresentasikan sangat tidak sehat,
+                    dan 4 merepresentasikan berbahaya.
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,224 @@
+import pandas as pd
+import streamlit as st
+
+import charts
+import cluster_profile
+import data_store
+import instrument
+import ispu
+import prediction
+import similarity
+from model_registry import registry as model_registry
+from views.common import DERIVED_CACHE_ENTRIES, load_data, plotly_chart, show_table
+
+# Grafik per klaster disimpan per (versi, klaster); cukup untuk model hingga 8 klaster
+CLUSTER_CHART_ENTRIES = 8
+
+
+# Indeks baris per klaster (kmeans_label) dari df2, dibuat sekali per versi data
+@instrument.timed('aggregation')
+@st.cache_resource(max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def cluster_rows(_frame, version):
+    return data_store.partition(_frame, 'kmeans_label')
+
+
+# Profil klaster (value_counts + rata-rata polutan) dihitung sekali untuk semua klaster
+@instrument.timed('aggregation')
+@st.cache_resource(max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def cluster_profiles(_frame, version):
+    return cluster_profile.build_profiles(_frame)
+
+
+# Grafik per klaster (spesifikasi Plotly) disimpan di cache; berpindah klaster cukup mengambil dari cache
+@instrument.timed('figure_render')
+@st.cache_resource(max_entries=DERIVED_CACHE_ENTRIES * CLUSTER_CHART_ENTRIES, show_spinner=False)
+def cluster_charts(_frame, version, label):
+    return charts.cluster_profile_charts(cluster_profiles(_frame, version)[label])
+
+
+# Indeks KD-tree "hari serupa" atas df2, dibangun sekali per versi data dan dipakai semua sesi
+@instrument.timed('aggregation')
+@st.cache_resource(max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def similarity_index(_frame, version):
+    return similarity.SimilarityIndex(_frame)
+
+
+# Catatan interpretasi per klaster (kategori AQI dari rata-rata polutan, lihat ispu.py)
+@st.cache_resource(max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def cluster_notes(_frame, version):
+    return cluster_profile.cluster_notes(cluster_profiles(_frame, version))
+
+
+# Prediction Main Panel
+def render():
+    # Option to select the view
+    options = ['Prediksi dengan Algoritma KNN', 'Prediksi Batch', 'Visualisasi Klaster']
+    selected_option3 = st.sidebar.selectbox('Pilih Opsi:', options)
+    instrument.tag(selected_option3)
+
+
+    if selected_option3 == 'Prediksi dengan Algoritma KNN':
+        st.markdown("<h1 style='text-align: center;'>Prediksi Klaster Kualitas Udara di Jakarta Menggunakan Algoritma KNN</h1>", unsafe_allow_html=True)
+
+        # Model dari registry (dimuat sekali per proses)
+        with instrument.stage('model_load'):
+            knn_clf = model_registry.get()
+            model_info = model_registry.info()
+        st.caption(f"Model: {model_info['model_class']} (sha256 {model_info['sha256'][:12]})")
+    
+        # Get inputs
+        stasiun = st.number_input('Stasiun:', min_value=0, max_value=4, value=0)
+        st.caption('Stasiun (lokasi pengukuran kualitas udara): 0 = DKI1 (Bunderan HI), 1 = DKI2 (Kelapa Gading), 2 = DKI3 (Jagakarsa), 3 = DKI4 (Lubang Buaya), dan 4 = DKI5 (Kebon Jeruk).')
+        pm10 = float(st.number_input('PM10:', value=0.0))
+        so2 = float(st.number_input('SO2:', value=0.0))
+        co = float(st.number_input('CO:', value=0.0))
+        o3 = float(st.number_input('O3:', value=0.0))
+        no2 = float(st.number_input('NO2:', value=0.0))
+        year = st.number_input('Tahun:', min_value=2019, max_value=2021, value=2019)
+        st.caption('Tahun (tahun pengukuran kualitas udara)')
+
+        # Create a DataFrame with the input data
+        data = pd.DataFrame({
+            'stasiun': [stasiun],
+            'pm10': [pm10],
+            'so2': [so2],
+            'co': [co],
+            'o3': [o3],
+            'no2': [no2],
+            'year': [year]
+        })
+
+        # max, critical, dan categori diturunkan dari nilai polutan (tidak diisi manual)
+        data = prediction.build_features(data)
+        derived = data.iloc[0]
+        st.caption(f"Max (nilai parameter tertinggi): {derived['max']:g}; "
+                   f"Critical: {int(derived['critical'])} ({ispu.POLLUTANTS[int(derived['critical'])]}); "
+                   f"Categori: {int(derived['categori'])} ({ispu.ISPU_LABELS[int(derived['categori'])].lower()})")
+
+        # Perform prediction using the loaded model (hasil disimpan di cache prediksi)
+        with instrument.stage('predict'):
+            proba = prediction.predict_proba(knn_clf, data, model_registry.version())
+        y_pred = knn_clf.classes_[proba.argmax(axis=1)]
+
+        # Determine the prediction message based on the predicted label
+        if y_pred[0] == 0:
+            msg = 'Data Kualitas Udara ini berada pada Klaster 0'
+            st.success(msg)
+        elif y_pred[0] == 1:
+            msg = 'Data kualitas udara ini berada pada Klaster 1'
+            st.success(msg)
+        elif y_pred[0] == 2:
+            msg = 'Data kualitas udara ini berada pada Klaster 2'
+            st.success(msg)
+        elif y_pred[0] == 3:
+            msg = 'Data kualitas udara ini berada pada Klaster 3'
+            st.success(msg)
+        elif y_pred[0] == 4:
+            msg = 'Data kualitas udara ini berada pada Klaster 4'
+            st.success(msg)
+        elif y_pred[0] == 5:
+            msg = 'Data kualitas udara ini berada pada Klaster 5'
+            st.success(msg)
+        else:
+            msg = 'Tidak ada Data'
+            st.error(msg)
+
+        # Station-day historis dengan nilai polutan paling mirip (dicari lewat indeks KD-tree)
+        st.subheader('Hari Serupa')
+        k = st.slider('Jumlah hari serupa:', min_value=1, max_value=20, value=5)
+        df2 = load_data('kmeans')
+        index = similarity_index(df2, data_store.frame_version(df2))
+        with instrument.stage('similarity'):
+            neighbours = index.neighbours(data, k)
+        neighbours = neighbours.drop(columns='query').assign(stasiun=neighbours['stasiun'].map(cluster_profile.STATION_NAMES))
+        st.dataframe(neighbours.rename(columns={'rank': 'Peringkat', 'distance': 'Jarak', 'stasiun': 'Stasiun',
+                                                'year': 'Tahun', 'kmeans_label': 'Klaster'}), hide_index=True)
+        st.caption('Jarak dihitung dari nilai PM10, SO2, CO, O3, dan NO2 yang distandardisasi; makin kecil makin mirip.')
+
+    elif selected_option3 == 'Prediksi Batch':
+        st.markdown("<h1 style='text-align: center;'>Prediksi Klaster Kualitas Udara secara Batch</h1>", unsafe_allow_html=True)
+
+        st.write('Unggah file CSV/Parquet dengan kolom: ' + ', '.join(prediction.INPUTS) + '. '
+                 'Kolom ' + ', '.join(prediction.DERIVED) + ' dihitung otomatis dari nilai polutan.')
+        uploaded = st.file_uploader('Pilih File', type=['csv', 'parquet'])
+
+        if uploaded is not None:
+            try:
+                with instrument.stage('data_fetch'):
+                    upload = prediction.read_upload(uploaded)
+                with instrument.stage('model_load'):
+                    model = model_registry.get()
+                # Upload tidak melewati cache prediksi per vektor (lihat prediction.CACHE_MAX_ROWS)
+                with instrument.stage('predict'):
+                    result = prediction.score(model, upload)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.write("Jumlah data:", len(result))
+                st.dataframe(result.head(1000), hide_index=True)
+                st.download_button('Unduh Hasil Prediksi', result.to_csv(index=False).encode('utf-8'),
+                                   file_name='prediksi_klaster.csv', mime='text/csv')
+
+    elif selected_option3 == 'Visualisasi Klaster':
+        # Menambahkan opsi pemilihan visualisasi
+        df2 = load_data('kmeans')
+        version = data_store.frame_version(df2)
+        cluster_labels = sorted(cluster_rows(df2, version))
+        visualization_option = st.selectbox("Pilih Visualisasi:", ['Distribusi Klaster'] + [f'Komposisi Klaster {label}' for label in cluster_labels])
+        instrument.tag(f'{selected_option3}: {visualization_option}')
+
+        if visualization_option == 'Distribusi Klaster':
+            st.markdown("<h1 style='text-align: center;'>Visualisasi Distribusi Klaster</h1>", unsafe_allow_html=True)
+
+            # Jumlah data per klaster dari profil klaster (tanpa value_counts ulang)
+            profiles = cluster_profiles(df2, version)
+            kmeans_label_counts = pd.Series({label: profile['size'] for label, profile in profiles.items()})
+            kmeans_label_counts = kmeans_label_counts.sort_values(ascending=False)
+
+            # Menambahkan caption di bawah bar plot
+            caption = "Jumlah data masing-masing cluster:"
+            for label, count in kmeans_label_counts.items():
+                caption += f"\nCluster {label}: {count} data,"
+
+            # Pie chart + bar chart (biru untuk yang terbanyak, abu-abu untuk lainnya)
+            plotly_chart(charts.cluster_distribution(kmeans_label_counts))
+            st.caption(caption)
+
+        else:
+            label = int(visualization_option.rsplit(' ', 1)[1])
+            rows = cluster_rows(df2, version)[label]
+            profile = cluster_profiles(df2, version)[label]
+            cluster_figs = cluster_charts(df2, version, label)
+
+            # Menampilkan dataframe
+            st.subheader(f'DataFrame Klaster {label}')
+            show_table(df2, rows, f'klaster_{label}')
+
+            # Tampilkan jumlah data
+            st.write(f"Jumlah data Klaster {label}:", profile['size'])
+
+            # Membagi layout menjadi 2 kolom
+            col1, col2 = st.columns(2)
+
+            # Menampilkan bar chart jumlah data per kolom 'stasiun' dan 'critical' di kolom 1
+            with col1:
+                st.subheader("Visualisasi Jumlah Data per Stasiun dan Critical")
+                plotly_chart(cluster_figs['stasiun'])
+                st.caption('Stasiun: 0 = DKI1 (Bunderan HI), 1 = DKI2 (Kelapa Gading), 2 = DKI3 (Jagakarsa), 3 = DKI4 (Lubang Buaya), dan 4 = DKI5 (Kebon Jeruk).')
+                plotly_chart(cluster_figs['critical'])
+                st.caption('Critical: 0 = pm10, 1 = so2, 2 = co, 3 = o3, dan 4 = no2.')
+
+            # Menampilkan bar chart jumlah data per kolom 'tahun' dan 'categori' di kolom 2
+            with col2:
+                st.subheader("Visualisasi Jumlah Data per Tahun dan Categori")
+                plotly_chart(cluster_figs['year'])
+                plotly_chart(cluster_figs['categori'])
+                st.caption('Kategori: 0 = baik, 1 = sedang, 2 = tidak sehat, dan 3 = sangat tidak sehat.')
+
+            # Rata-rata pm10, so2, co, o3, dan no2
+            st.write("Rata-rata parameter polusi:")
+            for pollutant, mean in profile['means'].items():
+                st.write(f"- Rata-rata {pollutant.upper()}:", mean)
+
+            with st.expander('Memahami Visualisasi', expanded=True):
+                st.write(cluster_notes(df2, version)[label])
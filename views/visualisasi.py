@@ -0,0 +1,169 @@
+import streamlit as st
+
+import charts
+import data_store
+import figures
+import ingest
+import instrument
+from figure_cache import cache as figure_cache
+from render_pool import pool as render_pool
+from views.common import DERIVED_CACHE_ENTRIES, load_data, plotly_chart
+
+
+# Agregat untuk panel Visualisasi: dari partisi ingesti jika ada, jika tidak dihitung dari df
+@st.cache_resource(max_entries=DERIVED_CACHE_ENTRIES, show_spinner=False)
+def df_aggregates(_frame, version):
+    return ingest.aggregate(_frame)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def ingest_aggregates():
+    return ingest.load_aggregates()
+
+
+@instrument.timed('aggregation')
+def visual_aggregates():
+    if ingest.has_partitions():
+        aggregates = ingest_aggregates()
+        return ingest.version(aggregates), aggregates
+    df = load_data('cleaned')
+    version = data_store.frame_version(df)
+    return version, df_aggregates(df, version)
+
+
+# Spesifikasi grafik Plotly panel Visualisasi, disimpan di figure cache per versi data dan potongan tahun/stasiun
+@instrument.timed('figure_render')
+def static_figure(chart, years=None, stations=None):
+    version, aggregates = visual_aggregates()
+    spec = (chart, tuple(years) if years is not None else None, tuple(stations) if stations is not None else None)
+    return figure_cache.get_or_render(version, spec, lambda: getattr(charts, chart)(aggregates, years, stations))
+
+
+# Ekspor PNG (matplotlib/seaborn) hanya dirender jika diminta lewat tombol (atau sudah ada di
+# figure cache); render berjalan di process pool dan halaman tidak menunggu render selesai.
+# Selama render berjalan, fragmen menampilkan placeholder dan memeriksa ulang setiap detik.
+def png_export(chart, years=None, stations=None):
+    version, aggregates = visual_aggregates()
+    spec = ('png', chart, tuple(years) if years is not None else None,
+            tuple(stations) if stations is not None else None)
+    # Render yang diminta sesi ini: ((versi, spec), Future). Future disimpan agar render yang
+    # gagal tidak diulang otomatis pada setiap rerun
+    requested = f'png_requested_{chart}'
+    request = st.session_state.get(requested)
+    future = request[1] if request is not None and request[0] == (version, spec) else None
+    if future is not None and future.done() and future.exception() is not None:
+        # Render gagal: tampilkan galatnya, lalu kembali ke tombol (bisa dicoba lagi)
+        del st.session_state[requested]
+        st.error(f'Gagal membuat PNG: {future.exception()}')
+        future = None
+    if future is None:
+        if figure_cache.get(version, spec) is None and not st.button('Siapkan PNG', key=f'png_request_{chart}'):
+            return
+        future = render_pool.submit(version, spec, getattr(figures, chart), aggregates, years, stations)
+        st.session_state[requested] = ((version, spec), future)
+    pending = not future.done()
+
+    @st.fragment(run_every=1 if pending else None)
+    def download():
+        if not future.done():
+            st.info('Menyiapkan gambar PNG...')
+        elif pending or future.exception() is not None:
+            # Render selesai atau gagal: satu rerun penuh agar fragmen berhenti memeriksa ulang
+            st.rerun()
+        else:
+            st.download_button('Unduh PNG', future.result(), file_name=f'{chart}.png', mime='image/png',
+                               key=f'png_{chart}')
+
+    download()
+
+
+# Filter tahun/stasiun di sidebar; None jika semua dipilih
+def slice_filters():
+    year_options, station_options = ingest.years_and_stations(visual_aggregates()[1])
+    years = st.sidebar.multiselect('Tahun', year_options, default=year_options)
+    stations = st.sidebar.multiselect('Stasiun', station_options, default=station_options)
+    return (None if len(years) == len(year_options) else years,
+            None if len(stations) == len(station_options) else stations)
+
+
+# Visualisasi Main Panel
+def render():
+    selected_option2 = st.sidebar.selectbox('Pilih Visualisasi:', ['Distribusi', 'Korelasi', 'Perbandingan', 'Komposisi'])
+    instrument.tag(selected_option2)
+
+    # Distribution Main Panel
+    if selected_option2 == 'Distribusi':
+
+        st.markdown("<h1 style='text-align: center;'>PANEL UTAMA DISTRIBUSI</h1>", unsafe_allow_html=True)
+
+        # Visualisasi Histogram (Distribution)
+        years, stations = slice_filters()
+        plotly_chart(static_figure('categori_distribution', years, stations))
+        png_export('categori_distribution', years, stations)
+
+        st.caption('Kategori: 0 = baik, 1 = sedang, 2 = tidak sehat, dan 3 = sangat tidak sehat.')
+
+        with st.expander('Memahami Visualisasi', expanded=True):
+            st.write('''
+            Visualisasi histogram distribusi/penyebaran kategori kualitas udara dalam dataset "Air Quality Index in Jakarta (2019 - 2021)" menunjukkan frekuensi masing-masing kategori kualitas udara di Jakarta selama periode tersebut. 
+            Setiap batang pada histogram mewakili frekuensi masing-masing kategori kualitas udara. Histogram memiliki sumbu-x yang menunjukkan kategori kualitas dan sumbu-y yang menunjukkan jumlah frekuensi setiap kategori.
+            Dari visualisasi ini, dapat dilihat bahwa kategori 1 atau "Sedang" memiliki frekuensi tertinggi atau terbanyak yaitu 2.271, diikuti oleh kategori 0 atau "Baik", kategori 2 atau "Tidak sehat", dan kategori 3 atau "Sangat tidak sehat". 
+            Ini menunjukkan bahwa sebagian besar waktu selama periode tersebut, kualitas udara di Jakarta dapat dikategorikan sebagai "Sedang". 
+            ''')
+
+    # Relationship Main Panel
+    if selected_option2 == 'Korelasi':
+
+        st.markdown("<h1 style='text-align: center;'>PANEL UTAMA KORELASI</h1>", unsafe_allow_html=True)
+
+        # Visualisasi Heatmap (Relationship)
+        years, stations = slice_filters()
+        plotly_chart(static_figure('pollutant_correlation', years, stations))
+        png_export('pollutant_correlation', years, stations)
+
+        with st.expander('Memahami Visualisasi', expanded=True):
+            st.write('''
+            Visualisasi heatmap relationship atau korelasi antara polutan dan nilai maksimal dalam dataset "Air Quality Index in Jakarta (2019 - 2021)" adalah cara yang efektif untuk memperlihatkan seberapa erat hubungan antara masing-masing polutan dan juga dengan nilai maksimal. 
+            Warna setiap sel menunjukkan tingkat korelasi dan arah korelasi antar variabel. Semakin biru (gelap) warna selnya, maka semakin rendah tingkat korelasinya. Sebaliknya, semakin merah (gelap) warna selnya, maka semakin tinggi tingkat korelasinya. 
+            Korelasi antara O3 dan nilai maksimal (Max) adalah 0.96, yang menunjukkan hubungan yang sangat kuat. Ini berarti konsentrasi O3 menjadi konsentrasi dengan perhitungan tertinggi (max) pada suatu waktu.
+            ''')
+
+    # Comparison Main Panel
+    if selected_option2 == 'Perbandingan':
+
+        st.markdown("<h1 style='text-align: center;'>PANEL UTAMA PERBANDINGAN</h1>", unsafe_allow_html=True)
+
+        # Visualisasi Stacked Bar
+        plotly_chart(static_figure('critical_per_station'))
+        png_export('critical_per_station')
+
+        st.caption('Stasiun (lokasi pengukuran kualitas udara): 0 = DKI1 (Bunderan HI), 1 = DKI2 (Kelapa Gading), 2 = DKI3 (Jagakarsa), 3 = DKI4 (Lubang Buaya), dan 4 = DKI5 (Kebon Jeruk).')
+        st.caption('Critical (nama parameter yang memiliki nilai tertinggi): 0 = pm10, 1 = so2, 2 = co, 3 = o3, dan 4 = no2.')
+
+        with st.expander('Memahami Visualisasi', expanded=True):
+            st.write('''
+            Visualisasi stacked barplot ini bertujuan untuk menyoroti jumlah polutan terbanyak dalam setiap stasiun dalam dataset "Air Quality Index in Jakarta (2019 - 2021)". 
+            Tinggi Stack Bar mewakili jumlah total polutan yang terukur di setiap stasiun. Stasiun 0 merepresentasikan DKI1 (Bunderan HI), Stasiun 1 merepresentasikan DKI2 (Kelapa Gading),
+            Stasiun 2 merepresentasikan DKI3 (Jagakarsa), Stasiun 3 merepresentasikan DKI4 (Lubang Buaya), dan Stasiun 4 merepresentasikan DKI5 (Kebon Jeruk).
+            Bagian dari Setiap Stack mewakili kontribusi masing-masing polutan terhadap total jumlah polutan di setiap stasiun. 
+            Critical 0 merepresentasikan PM10, Critical 1 merepresentasikan SO2, Critical 2 merepresentasikan CO, Critical 3 merepresentasikan O3, dan Critical 4 merepresentasikan NO2. 
+            Dalam kasus ini, Critical 3 atau parameter O3 (ozon) rata-rata menjadi parameter terbanyak di setiap stasiun.
+            ''')
+
+    # Composition Main Panel
+    if selected_option2 == 'Komposisi':
+
+        st.markdown("<h1 style='text-align: center;'>PANEL UTAMA KOMPOSISI</h1>", unsafe_allow_html=True)
+
+        # Visualisasi Pie Chart
+        plotly_chart(static_figure('categori_composition'))
+
+        st.caption('Kategori: 0 = baik, 1 = sedang, 2 = tidak sehat, dan 3 = sangat tidak sehat.')
+
+        with st.expander('Memahami Visualisasi', expanded=True):
+            st.write('''
+            Visualisasi Pie Chart untuk kategori kualitas udara dalam dataset "Air Quality Index in Jakarta (2019 - 2021)" menunjukkan proporsi persentase masing-masing kategori. 
+            Kategori 0 merepresentasikan baik, Kategori 1 merepresentasikan sedang, Kategori 2 merepresentasikan tidak sehat, dan Kategori 3 merepresentasikan sangat tidak sehat.
+            Kategori "sangat tidak sehat" memiliki proporsi terbesar dalam kualitas udara Jakarta dengan persentase sebesar 50%. 
+            Ini menunjukkan bahwa kualitas udara yang dimonitor berada dalam kategori sangat tidak sehat setengah dari total waktu pengamatan.
+            ''')